@@ -5,6 +5,13 @@ from __future__ import annotations
 import math
 
 SQRT3 = math.sqrt(3)
+HALF_SQRT3 = SQRT3 / 2.0
+SQRT3_OVER_3 = SQRT3 / 3.0
+
+# Unit-size corner offsets from a hex center (pointy-top: first corner at -30 degrees).
+POINTY_CORNER_OFFSETS: tuple[tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(60 * i - 30)), math.sin(math.radians(60 * i - 30))) for i in range(6)
+)
 
 # Axial neighbor offsets (pointy-top layout).
 AXIAL_DIRECTIONS = (
@@ -17,20 +24,63 @@ AXIAL_DIRECTIONS = (
 )
 
 
+def axial_neighbor_strides(
+    width: int,
+    height: int,
+    wrap_x: bool,
+) -> list[tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]]:
+    """Return per-row (first column, interior, last column) neighbor index offsets.
+
+    On a row-major grid of axial rows, a neighbor is `idx + offset`. Offsets keep
+    AXIAL_DIRECTIONS order and drop neighbors outside the grid (wrapping columns
+    when wrap_x), so kernels skip per-neighbor bounds and wrap checks.
+    """
+
+    def offsets(row: int, col: int) -> tuple[int, ...]:
+        result: list[int] = []
+        for dq, dr in AXIAL_DIRECTIONS:
+            n_row = row + dr
+            if n_row < 0 or n_row >= height:
+                continue
+            n_col = col + dq
+            if n_col < 0 or n_col >= width:
+                if not wrap_x:
+                    continue
+                n_col %= width
+            result.append((n_row - row) * width + (n_col - col))
+        return tuple(result)
+
+    def row_entry(row: int) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+        return offsets(row, 0), offsets(row, min(1, width - 1)), offsets(row, width - 1)
+
+    middle = row_entry(1) if height > 2 else None
+    return [row_entry(row) if row in (0, height - 1) else middle for row in range(height)]
+
+
 def axial_to_pixel(q: float, r: float, size: float) -> tuple[float, float]:
     """Convert axial coordinates to pixel center for pointy-top hexes."""
-    x = size * (SQRT3 * q + (SQRT3 / 2.0) * r)
+    x = size * (SQRT3 * q + HALF_SQRT3 * r)
     y = size * (1.5 * r)
     return x, y
 
 
 def pixel_to_axial(x: float, y: float, size: float) -> tuple[float, float]:
     """Convert pixel coordinates into fractional axial coordinates."""
-    q = ((SQRT3 / 3.0) * x - (1.0 / 3.0) * y) / size
+    q = (SQRT3_OVER_3 * x - (1.0 / 3.0) * y) / size
     r = ((2.0 / 3.0) * y) / size
     return q, r
 
 
+def axial_to_pixel_basis(size: float) -> tuple[float, float, float]:
+    """Return (x_per_q, x_per_r, y_per_r) so x = x_per_q*q + x_per_r*r, y = y_per_r*r."""
+    return size * SQRT3, size * HALF_SQRT3, size * 1.5
+
+
+def pixel_to_axial_basis(size: float) -> tuple[float, float, float]:
+    """Return (q_per_x, q_per_y, r_per_y) so q = q_per_x*x + q_per_y*y, r = r_per_y*y."""
+    return SQRT3_OVER_3 / size, -1.0 / (3.0 * size), 2.0 / (3.0 * size)
+
+
 def cube_round(x: float, y: float, z: float) -> tuple[int, int, int]:
     """Round fractional cube coordinates to the nearest valid hex."""
     rx = round(x)
@@ -41,14 +91,16 @@ def cube_round(x: float, y: float, z: float) -> tuple[int, int, int]:
     y_diff = abs(ry - y)
     z_diff = abs(rz - z)
 
-    if x_diff > y_diff and x_diff > z_diff:
-        rx = -ry - rz
-    elif y_diff > z_diff:
-        ry = -rx - rz
-    else:
-        rz = -rx - ry
+    # Rebuild the axis with the largest rounding error; ties resolve x -> y -> z.
+    fix_x = x_diff > y_diff and x_diff > z_diff
+    fix_y = not fix_x and y_diff > z_diff
+    fix_z = not fix_x and not fix_y
 
-    return int(rx), int(ry), int(rz)
+    return (
+        int(-ry - rz if fix_x else rx),
+        int(-rx - rz if fix_y else ry),
+        int(-rx - ry if fix_z else rz),
+    )
 
 
 def axial_round(q: float, r: float) -> tuple[int, int]:
@@ -62,9 +114,7 @@ def axial_round(q: float, r: float) -> tuple[int, int]:
 
 def axial_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
     """Return hex distance between two axial coordinates."""
-    aq, ar = a
-    bq, br = b
-    dx = aq - bq
-    dz = ar - br
-    dy = -dx - dz
-    return int(max(abs(dx), abs(dy), abs(dz)))
+    dq = a[0] - b[0]
+    dr = a[1] - b[1]
+    # Cube y-delta is -(dq + dr); its magnitude is all max() needs.
+    return max(abs(dq), abs(dr), abs(dq + dr))
@@ -6,9 +6,12 @@ from __future__ import annotations
 class TimeModel:
     """Tracks continuous local elapsed time and manual world ticks."""
 
+    __slots__ = ("local_elapsed_seconds", "world_tick_count", "_mmss_cache")
+
     def __init__(self) -> None:
         self.local_elapsed_seconds = 0.0
         self.world_tick_count = 0
+        self._mmss_cache: tuple[int, str] = (-1, "00:00")
 
     def update(self, dt: float) -> None:
         """Advance local realtime by frame delta seconds."""
@@ -22,6 +25,10 @@ class TimeModel:
     def local_elapsed_mmss(self) -> str:
         """Return local elapsed time as MM:SS."""
         total_seconds = int(self.local_elapsed_seconds)
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        cached_seconds, cached_text = self._mmss_cache
+        if total_seconds == cached_seconds:
+            return cached_text
+        minutes, seconds = divmod(total_seconds, 60)
+        text = f"{minutes:02d}:{seconds:02d}"
+        self._mmss_cache = (total_seconds, text)
+        return text
@@ -6,8 +6,19 @@ import pygame
 
 from hexcrawl.core.player import Player
 from hexcrawl.sim.time_model import TimeModel
+from hexcrawl.ui.panel_text import PanelText
 from hexcrawl.world.world_config import WorldConfig
 
+CONTROL_LINES: tuple[str, ...] = (
+    "Controls:",
+    "TAB: toggle mode",
+    "F2: debug verbosity",
+    "WASD: move cursor",
+    "T: world step",
+    "F11: toggle fullscreen",
+    "ESC: quit",
+)
+
 
 class LocalMapView:
     """Renders a square local grid placeholder in the left map area."""
@@ -36,14 +47,20 @@ class LocalMapView:
         self.cursor_color = (224, 188, 92)
         self.panel_bg = (28, 32, 40)
         self.panel_text = (225, 230, 240)
+        self._panel_bg_surface = pygame.Surface((self.panel_width, self.map_height))
+        self._panel_bg_surface.fill(self.panel_bg)
 
-        self.font = pygame.font.SysFont("consolas", 18)
+        self._panel_text = PanelText(self.panel_text, self.panel_bg)
+        self._controls_surface = self._panel_text.block(CONTROL_LINES, self.panel_width - 14)
         self.time_model = time_model
         self.player = player
         self.world_config = world_config
         self.world_seed = world_seed
         self.climate_seed = climate_seed
         self.debug_verbosity = "STD"
+        # Static grid lines, re-rendered only when map or grid dimensions change.
+        self._grid_surface: pygame.Surface | None = None
+        self._grid_surface_key: tuple[int, int, int, int] | None = None
 
     def set_debug_verbosity(self, verbosity: str) -> None:
         if verbosity not in {"MIN", "STD", "ADV"}:
@@ -81,25 +98,32 @@ class LocalMapView:
         origin_x = (self.map_width - grid_pixel_w) / 2.0
         origin_y = (self.map_height - grid_pixel_h) / 2.0
 
-        for gx in range(self.grid_w + 1):
-            x = origin_x + gx * cell_size
-            pygame.draw.line(
-                screen,
-                self.grid_line_color,
-                (round(x), round(origin_y)),
-                (round(x), round(origin_y + grid_pixel_h)),
-                width=1,
-            )
-
-        for gy in range(self.grid_h + 1):
-            y = origin_y + gy * cell_size
-            pygame.draw.line(
-                screen,
-                self.grid_line_color,
-                (round(origin_x), round(y)),
-                (round(origin_x + grid_pixel_w), round(y)),
-                width=1,
-            )
+        grid_key = (self.map_width, self.map_height, self.grid_w, self.grid_h)
+        if self._grid_surface is None or self._grid_surface_key != grid_key:
+            grid_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+            for gx in range(self.grid_w + 1):
+                x = origin_x + gx * cell_size
+                pygame.draw.line(
+                    grid_surface,
+                    self.grid_line_color,
+                    (round(x), round(origin_y)),
+                    (round(x), round(origin_y + grid_pixel_h)),
+                    width=1,
+                )
+
+            for gy in range(self.grid_h + 1):
+                y = origin_y + gy * cell_size
+                pygame.draw.line(
+                    grid_surface,
+                    self.grid_line_color,
+                    (round(origin_x), round(y)),
+                    (round(origin_x + grid_pixel_w), round(y)),
+                    width=1,
+                )
+            self._grid_surface = grid_surface
+            self._grid_surface_key = grid_key
+
+        screen.blit(self._grid_surface, (0, 0))
 
         cursor_rect = pygame.Rect(
             round(origin_x + self.cursor_x * cell_size),
@@ -114,8 +138,7 @@ class LocalMapView:
         screen: pygame.Surface,
         context_world_hex: tuple[int, int],
     ) -> None:
-        panel_rect = pygame.Rect(self.map_width, 0, self.panel_width, self.map_height)
-        pygame.draw.rect(screen, self.panel_bg, panel_rect)
+        screen.blit(self._panel_bg_surface, (self.map_width, 0))
 
         lines = [
             "Mode: LOCAL",
@@ -150,21 +173,10 @@ class LocalMapView:
                 ]
             )
 
-        lines.extend(
-            [
-                "",
-                "Controls:",
-                "TAB: toggle mode",
-                "F2: debug verbosity",
-                "WASD: move cursor",
-                "T: world step",
-                "F11: toggle fullscreen",
-                "ESC: quit",
-            ]
+        x = self.map_width + 14
+        screen.blits(
+            [(self._panel_text.line(line), (x, 18 + 24 * idx)) for idx, line in enumerate(lines)],
+            doreturn=False,
         )
-
-        y = 18
-        for line in lines:
-            text_surface = self.font.render(line, True, self.panel_text)
-            screen.blit(text_surface, (self.map_width + 14, y))
-            y += 24
+        # Blank spacer line, then the pre-rendered static controls block.
+        screen.blit(self._controls_surface, (x, 18 + 24 * (len(lines) + 1)))
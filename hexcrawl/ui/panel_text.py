@@ -0,0 +1,46 @@
+"""Cached text rendering shared by the debug panels."""
+
+from __future__ import annotations
+
+import pygame
+
+
+class PanelText:
+    """Renders panel text in one font and color on the panel background.
+
+    Per-line surfaces are cached by text; the cache is cleared wholesale once it
+    grows past `maxsize`.
+    """
+
+    line_height = 24
+
+    def __init__(
+        self,
+        color: tuple[int, int, int],
+        background: tuple[int, int, int],
+        maxsize: int = 256,
+    ) -> None:
+        self.font = pygame.font.SysFont("consolas", 18)
+        self.color = color
+        self.background = background
+        self._cache: dict[str, pygame.Surface] = {}
+        self._cache_maxsize = maxsize
+
+    def line(self, text: str) -> pygame.Surface:
+        surface = self._cache.get(text)
+        if surface is None:
+            if len(self._cache) >= self._cache_maxsize:
+                self._cache.clear()
+            surface = self.font.render(text, True, self.color)
+            self._cache[text] = surface
+        return surface
+
+    def block(self, lines: tuple[str, ...], width: int) -> pygame.Surface:
+        """Render a static block of lines once, on the panel background color."""
+        surface = pygame.Surface((width, self.line_height * len(lines)))
+        surface.fill(self.background)
+        for idx, text in enumerate(lines):
+            surface.blit(self.font.render(text, True, self.color), (0, self.line_height * idx))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
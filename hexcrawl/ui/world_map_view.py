@@ -7,12 +7,38 @@ from enum import Enum
 
 import pygame
 
-from hexcrawl.core.hex_math import axial_distance, axial_round, axial_to_pixel, pixel_to_axial
+from hexcrawl.core.hex_math import (
+    POINTY_CORNER_OFFSETS,
+    SQRT3,
+    axial_distance,
+    axial_round,
+    axial_to_pixel_basis,
+    pixel_to_axial_basis,
+)
 from hexcrawl.core.player import Player
 from hexcrawl.sim.time_model import TimeModel
-from hexcrawl.world.climate import BiomeType, ClimateGen, ClimateTile
+from hexcrawl.ui.panel_text import PanelText
+from hexcrawl.world.climate import BIOME_TYPES, BiomeType, ClimateGen, ClimateTile
+from hexcrawl.world.hydrology import RiverBlock
 from hexcrawl.world.world_config import WorldConfig
-from hexcrawl.world.worldgen import TerrainType, WorldGen
+from hexcrawl.world.worldgen import TERRAIN_TYPES, TerrainType, WorldGen, WorldTile
+
+
+CONTROL_LINES: tuple[str, ...] = (
+    "Controls:",
+    "TAB: toggle mode",
+    "F2: debug verbosity",
+    "LMB: select hex",
+    "ENTER/G: travel to selected",
+    "B: toggle biome view",
+    "R: toggle rivers",
+    "[/]: river threshold -/+",
+    "RMB drag: pan",
+    "Wheel: zoom",
+    "F11: toggle fullscreen",
+    "T: world step",
+    "ESC: quit",
+)
 
 
 class ColorMode(str, Enum):
@@ -51,6 +77,20 @@ class WorldMapView:
         self.hover_hex: tuple[int, int] | None = None
         self.selected_hex: tuple[int, int] | None = None
         self.mouse_pixel = (0, 0)
+        # Mouse position hover_hex was last resolved for; None forces a re-resolve.
+        self._last_hover_input: tuple[int, int] | None = None
+
+        # Pointy-top corner offsets only depend on hex_size; rebuilt on zoom change.
+        self._corner_offsets: tuple[tuple[float, float], ...] = ()
+        self._refresh_corner_offsets()
+        # Pre-rendered filled+outlined hex per fill color, blitted in one batch per frame.
+        self._hex_sprites: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._hex_sprites_size: float | None = None
+        self._hex_sprite_anchor = (0, 0)
+        # Axial<->pixel bases scaled by hex_size; rebuilt on zoom change.
+        self._basis_size: float | None = None
+        self._a2p = (0.0, 0.0, 0.0)
+        self._p2a = (0.0, 0.0, 0.0)
 
         self.background_color = (16, 18, 22)
         self.grid_line_color = (76, 86, 102)
@@ -59,8 +99,26 @@ class WorldMapView:
         self.player_color = (152, 195, 121)
         self.panel_bg = (28, 32, 40)
         self.panel_text = (225, 230, 240)
-
-        self.font = pygame.font.SysFont("consolas", 18)
+        self._panel_bg_surface = pygame.Surface((self.panel_width, self.world_height))
+        self._panel_bg_surface.fill(self.panel_bg)
+
+        self._panel_text = PanelText(self.panel_text, self.panel_bg)
+        self._controls_surface = self._panel_text.block(CONTROL_LINES, self.panel_width - 14)
+        self._panel_lines: list[str] = []
+        self._panel_key: tuple[object, ...] | None = None
+        self._panel_cache: tuple[tuple[str, ...], pygame.Surface] | None = None
+        self._cached_frame: pygame.Surface | None = None
+        self._cached_frame_key: tuple[object, ...] | None = None
+        self._frame_tile_cache: dict[tuple[int, int], tuple[WorldTile, ClimateTile]] = {}
+        self._viewport_key: tuple[object, ...] | None = None
+        self._viewport_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._viewport_hexes: list[tuple[int, int, float, float]] = []
+        self._viewport_positions: dict[tuple[int, int], tuple[int, float, float]] = {}
+        self._viewport_bounds: tuple[int, int, int, int] = (0, 0, -1, -1)
+        self._river_block_bounds: tuple[int, int, int, int] | None = None
+        self._river_block: RiverBlock | None = None
+        self._river_overlay_key: tuple[object, ...] | None = None
+        self._river_overlay: list[tuple[tuple[float, float], tuple[float, float] | None, int]] = []
         self.time_model = time_model
         self.player = player
         self.world_gen = world_gen
@@ -80,6 +138,10 @@ class WorldMapView:
             TerrainType.MOUNTAINS: (126, 132, 142),
             TerrainType.SNOW: (228, 235, 245),
         }
+        # Colors indexed by WorldGen terrain id, avoiding per-tile tile/dict lookups.
+        self.terrain_color_lut: tuple[tuple[int, int, int], ...] = tuple(
+            self.terrain_colors[terrain] for terrain in TERRAIN_TYPES
+        )
 
         self.biome_colors: dict[BiomeType, tuple[int, int, int]] = {
             BiomeType.OCEAN: (45, 89, 134),
@@ -92,6 +154,32 @@ class WorldMapView:
             BiomeType.TUNDRA: (164, 174, 166),
             BiomeType.ALPINE: (205, 211, 222),
         }
+        # Colors indexed by ClimateGen biome id, for bulk viewport coloring.
+        self.biome_color_lut: tuple[tuple[int, int, int], ...] = tuple(
+            self.biome_colors[biome] for biome in BIOME_TYPES
+        )
+
+        self._event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+            pygame.KEYDOWN: self._on_key_down,
+        }
+        self._button_handlers = {
+            1: self._select_at,
+            3: self._start_drag,
+            4: self._zoom_in_at,
+            5: self._zoom_out_at,
+        }
+        self._key_handlers = {
+            pygame.K_RETURN: self.travel_to_selected,
+            pygame.K_g: self.travel_to_selected,
+            pygame.K_r: self._toggle_rivers,
+            pygame.K_LEFTBRACKET: self._lower_river_threshold,
+            pygame.K_RIGHTBRACKET: self._raise_river_threshold,
+            pygame.K_b: self._toggle_color_mode,
+        }
 
     @property
     def hex_size(self) -> float:
@@ -103,53 +191,80 @@ class WorldMapView:
             return None
         return axial_distance(self.player.hex_pos, self.selected_hex)
 
+    def on_activate(self) -> None:
+        """Resync pointer state when the view becomes active.
+
+        Mouse events only reach the active view, so the position tracked from
+        MOUSEMOTION is stale after LOCAL mode (or unset at startup).
+        """
+        self.mouse_pixel = pygame.mouse.get_pos()
+        self._last_hover_input = None
+        # A button release may have gone to the other view mid-drag.
+        self.dragging = False
+        self.last_mouse_pos = None
+
     def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 3:
-                self.dragging = True
-                self.last_mouse_pos = event.pos
-            elif event.button == 1 and self._mouse_in_world(event.pos):
-                self.selected_hex = self._screen_to_axial(event.pos[0], event.pos[1])
-            elif event.button == 4:
-                self._apply_zoom(1.1, event.pos)
-            elif event.button == 5:
-                self._apply_zoom(1.0 / 1.1, event.pos)
-
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 3:
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> None:
+        handler = self._button_handlers.get(event.button)
+        if handler is not None:
+            handler(event.pos)
+
+    def _on_mouse_button_up(self, event: pygame.event.Event) -> None:
+        if event.button == 3:
             self.dragging = False
             self.last_mouse_pos = None
 
-        elif event.type == pygame.MOUSEMOTION:
-            self.mouse_pixel = event.pos
-            if self.dragging and self.last_mouse_pos is not None:
-                dx = event.pos[0] - self.last_mouse_pos[0]
-                dy = event.pos[1] - self.last_mouse_pos[1]
-                self.camera_offset_x += dx
-                self.camera_offset_y += dy
-                self.last_mouse_pos = event.pos
+    def _on_mouse_motion(self, event: pygame.event.Event) -> None:
+        self.mouse_pixel = event.pos
+        if self.dragging and self.last_mouse_pos is not None:
+            dx = event.pos[0] - self.last_mouse_pos[0]
+            dy = event.pos[1] - self.last_mouse_pos[1]
+            self.camera_offset_x += dx
+            self.camera_offset_y += dy
+            self.last_mouse_pos = event.pos
+            self._last_hover_input = None
 
-        elif event.type == pygame.MOUSEWHEEL:
-            if event.y > 0:
-                self._apply_zoom(1.1, pygame.mouse.get_pos())
-            elif event.y < 0:
-                self._apply_zoom(1.0 / 1.1, pygame.mouse.get_pos())
+    def _on_mouse_wheel(self, event: pygame.event.Event) -> None:
+        # MOUSEWHEEL carries no position; mouse_pixel tracks the last MOUSEMOTION.
+        if event.y > 0:
+            self._apply_zoom(1.1, self.mouse_pixel)
+        elif event.y < 0:
+            self._apply_zoom(1.0 / 1.1, self.mouse_pixel)
 
-        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_g):
-            self.travel_to_selected()
+    def _on_key_down(self, event: pygame.event.Event) -> None:
+        handler = self._key_handlers.get(event.key)
+        if handler is not None:
+            handler()
 
-        elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-            self.show_rivers = not self.show_rivers
+    def _select_at(self, pos: tuple[int, int]) -> None:
+        if self._mouse_in_world(pos):
+            self.selected_hex = self._screen_to_axial(pos[0], pos[1])
 
-        elif event.type == pygame.KEYDOWN and event.key == pygame.K_LEFTBRACKET:
-            self.river_threshold = max(1, self.river_threshold - self.river_threshold_step)
+    def _start_drag(self, pos: tuple[int, int]) -> None:
+        self.dragging = True
+        self.last_mouse_pos = pos
 
-        elif event.type == pygame.KEYDOWN and event.key == pygame.K_RIGHTBRACKET:
-            self.river_threshold += self.river_threshold_step
+    def _zoom_in_at(self, pos: tuple[int, int]) -> None:
+        self._apply_zoom(1.1, pos)
 
-        elif event.type == pygame.KEYDOWN and event.key == pygame.K_b:
-            self.color_mode = (
-                ColorMode.BIOME if self.color_mode == ColorMode.TERRAIN else ColorMode.TERRAIN
-            )
+    def _zoom_out_at(self, pos: tuple[int, int]) -> None:
+        self._apply_zoom(1.0 / 1.1, pos)
+
+    def _toggle_rivers(self) -> None:
+        self.show_rivers = not self.show_rivers
+
+    def _lower_river_threshold(self) -> None:
+        self.river_threshold = max(1, self.river_threshold - self.river_threshold_step)
+
+    def _raise_river_threshold(self) -> None:
+        self.river_threshold += self.river_threshold_step
+
+    def _toggle_color_mode(self) -> None:
+        self.color_mode = ColorMode.BIOME if self.color_mode == ColorMode.TERRAIN else ColorMode.TERRAIN
 
     def set_debug_verbosity(self, verbosity: str) -> None:
         if verbosity not in {"MIN", "STD", "ADV"}:
@@ -170,16 +285,38 @@ class WorldMapView:
 
     def update(self, dt: float) -> None:
         del dt
-        mx, my = pygame.mouse.get_pos()
-        self.mouse_pixel = (mx, my)
+        # mouse_pixel is kept current by MOUSEMOTION events; no per-frame SDL query.
+        mx, my = self.mouse_pixel
+        if (mx, my) == self._last_hover_input:
+            return
+        self._last_hover_input = (mx, my)
         if self._mouse_in_world((mx, my)):
             self.hover_hex = self._screen_to_axial(mx, my)
         else:
             self.hover_hex = None
 
     def draw(self, screen: pygame.Surface) -> None:
-        screen.fill(self.background_color)
-        self._draw_hex_grid(screen)
+        self._frame_tile_cache.clear()
+        # World data is deterministic, so the map base (fills and rivers) only changes
+        # with the view; hover/selection/player outlines are drawn on top every frame.
+        base_key = (
+            screen.get_size(),
+            self.camera_offset_x,
+            self.camera_offset_y,
+            self.zoom,
+            self.color_mode,
+            self.show_rivers,
+            self.river_threshold,
+        )
+        if self._cached_frame is None or base_key != self._cached_frame_key:
+            map_size = pygame.Rect(0, 0, self.world_width, self.world_height).clip(screen.get_rect()).size
+            if self._cached_frame is None or self._cached_frame.get_size() != map_size:
+                self._cached_frame = pygame.Surface(map_size, 0, screen)
+            self._cached_frame.fill(self.background_color)
+            self._draw_hex_grid(self._cached_frame)
+            self._cached_frame_key = base_key
+        screen.blit(self._cached_frame, (0, 0))
+        self._draw_hex_outlines(screen)
         self._draw_debug_panel(screen)
 
     def _mouse_in_world(self, pos: tuple[int, int]) -> bool:
@@ -193,82 +330,174 @@ class WorldMapView:
 
     def _screen_to_axial(self, sx: float, sy: float) -> tuple[int, int]:
         wx, wy = self._screen_to_world(sx, sy)
-        fq, fr = pixel_to_axial(wx, wy, self.hex_size)
-        return axial_round(fq, fr)
+        q_per_x, q_per_y, r_per_y = self._zoom_basis()[1]
+        return axial_round(q_per_x * wx + q_per_y * wy, r_per_y * wy)
+
+    def _zoom_basis(
+        self,
+    ) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+        size = self.hex_size
+        if size != self._basis_size:
+            self._a2p = axial_to_pixel_basis(size)
+            self._p2a = pixel_to_axial_basis(size)
+            self._basis_size = size
+        return self._a2p, self._p2a
+
+    def _refresh_corner_offsets(self) -> None:
+        size = self.hex_size
+        self._corner_offsets = tuple((size * ox, size * oy) for ox, oy in POINTY_CORNER_OFFSETS)
 
     def _hex_corners(self, center_x: float, center_y: float) -> list[tuple[float, float]]:
-        points: list[tuple[float, float]] = []
-        # Pointy-top orientation: corner angle starts at -30 degrees.
-        for i in range(6):
-            angle = math.radians(60 * i - 30)
-            x = center_x + self.hex_size * math.cos(angle)
-            y = center_y + self.hex_size * math.sin(angle)
-            points.append((x, y))
-        return points
-
-    def _tile_color(self, q: int, r: int) -> tuple[int, int, int]:
-        tile = self.world_gen.get_tile(q, r)
+        return [(center_x + ox, center_y + oy) for ox, oy in self._corner_offsets]
+
+    def _hex_sprite(self, fill_color: tuple[int, int, int]) -> pygame.Surface:
+        size = self.hex_size
+        if size != self._hex_sprites_size:
+            self._hex_sprites.clear()
+            self._hex_sprites_size = size
+            self._hex_sprite_anchor = (math.ceil(SQRT3 * size / 2.0) + 1, math.ceil(size) + 1)
+
+        sprite = self._hex_sprites.get(fill_color)
+        if sprite is None:
+            anchor_x, anchor_y = self._hex_sprite_anchor
+            sprite = pygame.Surface((anchor_x * 2 + 1, anchor_y * 2 + 1), pygame.SRCALPHA)
+            points = self._hex_corners(anchor_x, anchor_y)
+            pygame.draw.polygon(sprite, fill_color, points, width=0)
+            pygame.draw.polygon(sprite, self.grid_line_color, points, width=1)
+            if pygame.display.get_surface() is not None:
+                # Match the display pixel format so batched blits skip per-pixel conversion.
+                sprite = sprite.convert_alpha()
+            self._hex_sprites[fill_color] = sprite
+        return sprite
+
+    def _viewport_colors(
+        self, visible_hexes: list[tuple[int, int, float, float]]
+    ) -> list[tuple[int, int, int]]:
+        """Return fill colors for the visible hexes, resolved in one batch."""
         if self.color_mode == ColorMode.TERRAIN:
-            return self.terrain_colors[tile.terrain_type]
-        climate = self.climate_gen.get_tile(q, r, tile.terrain_type, tile.height)
-        return self.biome_colors[climate.biome_type]
+            get_terrain_id = self.world_gen.get_terrain_id
+            terrain_lut = self.terrain_color_lut
+            return [terrain_lut[get_terrain_id(q, r)] for q, r, _, _ in visible_hexes]
+
+        qs = [q for q, _, _, _ in visible_hexes]
+        rs = [r for _, r, _, _ in visible_hexes]
+        get_tile = self.world_gen.get_tile
+        tiles = [get_tile(q, r) for q, r in zip(qs, rs)]
+        _, _, biome_ids = self.climate_gen.get_tiles_bulk(
+            qs,
+            rs,
+            [tile.terrain_type for tile in tiles],
+            [tile.height for tile in tiles],
+        )
+        biome_lut = self.biome_color_lut
+        return [biome_lut[biome_id] for biome_id in biome_ids]
+
+    def _frame_tile(self, q: int, r: int) -> tuple[WorldTile, ClimateTile]:
+        """Return world + climate tile, memoized for the current frame."""
+        entry = self._frame_tile_cache.get((q, r))
+        if entry is None:
+            tile = self.world_gen.get_tile(q, r)
+            entry = (tile, self.climate_gen.get_tile(q, r, tile.terrain_type, tile.height))
+            self._frame_tile_cache[(q, r)] = entry
+        return entry
 
     def _climate_for_hex(self, hex_coords: tuple[int, int] | None) -> ClimateTile | None:
         if hex_coords is None:
             return None
-        q, r = hex_coords
-        tile = self.world_gen.get_tile(q, r)
-        return self.climate_gen.get_tile(q, r, tile.terrain_type, tile.height)
+        return self._frame_tile(*hex_coords)[1]
 
     def _draw_hex_grid(self, screen: pygame.Surface) -> None:
-        margin = self.hex_size
-        corners = [
-            self._screen_to_world(-margin, -margin),
-            self._screen_to_world(self.world_width + margin, -margin),
-            self._screen_to_world(self.world_width + margin, self.world_height + margin),
-            self._screen_to_world(-margin, self.world_height + margin),
-        ]
-        qs: list[float] = []
-        rs: list[float] = []
-        for wx, wy in corners:
-            q, r = pixel_to_axial(wx, wy, self.hex_size)
-            qs.append(q)
-            rs.append(r)
-
-        q_min = math.floor(min(qs)) - 2
-        q_max = math.ceil(max(qs)) + 2
-        r_min = math.floor(min(rs)) - 2
-        r_max = math.ceil(max(rs)) + 2
-
-        player_q, player_r = self.player.hex_pos
-        visible_hexes: list[tuple[int, int, float, float]] = []
+        blit_sequence, visible_hexes = self._viewport_grid()
+        screen.blits(blit_sequence, doreturn=False)
 
-        for q in range(q_min, q_max + 1):
-            for r in range(r_min, r_max + 1):
-                wx, wy = axial_to_pixel(q, r, self.hex_size)
-                sx, sy = self._world_to_screen(wx, wy)
-                points = self._hex_corners(sx, sy)
+        self._draw_river_overlay(screen, visible_hexes)
 
-                if not self.world_config.is_r_in_bounds(r):
-                    continue
+    def _draw_hex_outlines(self, screen: pygame.Surface) -> None:
+        # At most three hexes get an outline: look them up directly instead of
+        # scanning every visible hex. Sorting by draw order keeps shared edges
+        # layered exactly as a full scan would.
+        positions = self._viewport_positions
+        outlines: list[tuple[int, float, float, tuple[int, int, int], int]] = []
+        for coords, color, width in (
+            (self.hover_hex, self.hover_color, 3),
+            (self.selected_hex, self.selected_color, 4),
+            (self.player.hex_pos, self.player_color, 6),
+        ):
+            entry = None if coords is None else positions.get(coords)
+            if entry is not None:
+                outlines.append((entry[0], entry[1], entry[2], color, width))
+        outlines.sort(key=lambda outline: outline[0])
+        for _, sx, sy, color, width in outlines:
+            pygame.draw.polygon(screen, color, self._hex_corners(sx, sy), width=width)
+
+    def _viewport_grid(
+        self,
+    ) -> tuple[list[tuple[pygame.Surface, tuple[int, int]]], list[tuple[int, int, float, float]]]:
+        """Return the fill blits and visible (q, r, sx, sy) hexes for the current view.
 
-                fill_color = self._tile_color(q, r)
-                pygame.draw.polygon(screen, fill_color, points, width=0)
-                pygame.draw.polygon(screen, self.grid_line_color, points, width=1)
-                visible_hexes.append((q, r, sx, sy))
+        Both only depend on camera, zoom and color mode, so they are reused while
+        river overlay changes re-render the map base.
+        """
+        viewport_key = (self.camera_offset_x, self.camera_offset_y, self.zoom, self.color_mode)
+        if viewport_key == self._viewport_key:
+            return self._viewport_blits, self._viewport_hexes
 
-        self._draw_river_overlay(screen, visible_hexes)
+        margin = self.hex_size
+        left, top = self._screen_to_world(-margin, -margin)
+        right, bottom = self._screen_to_world(self.world_width + margin, self.world_height + margin)
+
+        # q grows with x and shrinks with y, r grows with y: the axial extremes of
+        # the viewport rectangle sit at known corners, no per-corner min/max needed.
+        q_per_x, q_per_y, r_per_y = self._zoom_basis()[1]
+        q_min = math.floor(q_per_x * left + q_per_y * bottom) - 2
+        q_max = math.ceil(q_per_x * right + q_per_y * top) + 2
+        r_min = math.floor(r_per_y * top) - 2
+        r_max = math.ceil(r_per_y * bottom) + 2
+
+        # Out-of-world rows (and columns, without x-wrap) are never drawn.
+        r_min = max(r_min, self.world_config.r_min)
+        r_max = min(r_max, self.world_config.r_max)
+        if not self.world_config.wrap_x:
+            q_min = max(q_min, self.world_config.q_min)
+            q_max = min(q_max, self.world_config.q_max)
+
+        # axial->pixel with the per-column and per-row terms hoisted out of the tile loop.
+        x_per_q, x_per_r, y_per_r = self._zoom_basis()[0]
+        columns = [(q, x_per_q * q + self.camera_offset_x) for q in range(q_min, q_max + 1)]
+        rows = [(r, x_per_r * r, y_per_r * r + self.camera_offset_y) for r in range(r_min, r_max + 1)]
+
+        # Cull hexes whose centers lie more than two hex sizes outside the viewport:
+        # they and all their neighbors are fully off-screen, so river segments
+        # crossing the edge are still drawn from the on-screen side.
+        cull = 2.0 * self.hex_size
+        x_lo, x_hi = -cull, self.world_width + cull
+        y_lo, y_hi = -cull, self.world_height + cull
+        rows = [row for row in rows if y_lo <= row[2] <= y_hi]
 
-        for q, r, sx, sy in visible_hexes:
-            points = self._hex_corners(sx, sy)
-            if self.hover_hex is not None and (q, r) == self.hover_hex:
-                pygame.draw.polygon(screen, self.hover_color, points, width=3)
+        visible_hexes: list[tuple[int, int, float, float]] = []
+        for q, q_term in columns:
+            for r, r_term, sy in rows:
+                sx = q_term + r_term
+                if sx < x_lo or sx > x_hi:
+                    continue
+                visible_hexes.append((q, r, sx, sy))
 
-            if self.selected_hex is not None and (q, r) == self.selected_hex:
-                pygame.draw.polygon(screen, self.selected_color, points, width=4)
+        # Sprites first: building one refreshes the anchor for the current zoom.
+        sprites = [self._hex_sprite(color) for color in self._viewport_colors(visible_hexes)]
+        anchor_x, anchor_y = self._hex_sprite_anchor
+        blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = [
+            (sprite, (round(sx) - anchor_x, round(sy) - anchor_y))
+            for sprite, (_, _, sx, sy) in zip(sprites, visible_hexes)
+        ]
 
-            if (q, r) == (player_q, player_r):
-                pygame.draw.polygon(screen, self.player_color, points, width=6)
+        self._viewport_blits = blit_sequence
+        self._viewport_hexes = visible_hexes
+        self._viewport_positions = {
+            (q, r): (order, sx, sy) for order, (q, r, sx, sy) in enumerate(visible_hexes)
+        }
+        self._viewport_bounds = (q_min, r_min, q_max, r_max)
+        self._viewport_key = viewport_key
+        return blit_sequence, visible_hexes
 
     def _draw_river_overlay(
         self,
@@ -280,24 +509,55 @@ class WorldMapView:
 
         river_color = (52, 152, 219)
         lake_color = (86, 178, 255)
-
+        lake_radius = max(2, int(self.hex_size * 0.20))
+        for start, end, width in self._river_overlay_items(visible_hexes):
+            if end is None:
+                pygame.draw.circle(screen, lake_color, start, lake_radius)
+            else:
+                pygame.draw.line(screen, river_color, start, end, width=width)
+
+    def _river_overlay_items(
+        self,
+        visible_hexes: list[tuple[int, int, float, float]],
+    ) -> list[tuple[tuple[float, float], tuple[float, float] | None, int]]:
+        """Return (start, end, width) river segments and (center, None, 0) lake dots in draw order.
+
+        Only depends on the viewport and river threshold, so hover/selection
+        re-renders redraw the cached items without touching any hex lookups.
+        """
+        overlay_key = (self._viewport_key, self.river_threshold)
+        if overlay_key == self._river_overlay_key:
+            return self._river_overlay
+        x_per_q, x_per_r, y_per_r = self._zoom_basis()[0]
+        threshold = self.river_threshold
+
+        # River data is static per world, so the block is only re-queried when the
+        # visible axial bounds change (not on threshold changes).
+        q0, r0, q1, r1 = self._viewport_bounds
+        if self._river_block_bounds != self._viewport_bounds:
+            self._river_block = self.world_gen.get_river_block(q0, r0, q1, r1)
+            self._river_block_bounds = self._viewport_bounds
+        strengths, flows, lakes = self._river_block
+        row_stride = q1 - q0 + 1
+
+        items: list[tuple[tuple[float, float], tuple[float, float] | None, int]] = []
         for q, r, sx, sy in visible_hexes:
-            strength = self.world_gen.get_river_strength(q, r)
-            if strength < self.river_threshold:
-                if self.world_gen.is_lake(q, r):
-                    pygame.draw.circle(screen, lake_color, (int(sx), int(sy)), max(2, int(self.hex_size * 0.20)))
+            idx = (r - r0) * row_stride + (q - q0)
+            strength = strengths[idx]
+            if strength < threshold:
+                if lakes[idx]:
+                    items.append(((int(sx), int(sy)), None, 0))
                 continue
 
-            flow_to = self.world_gen.get_flow_to(q, r)
+            flow_to = flows[idx]
             if flow_to is None:
                 continue
 
             downstream_q, downstream_r = flow_to
             downstream_strength = self.world_gen.get_river_strength(downstream_q, downstream_r)
-            downstream_tile = self.world_gen.get_tile(downstream_q, downstream_r)
             if (
-                downstream_strength < self.river_threshold
-                and downstream_tile.terrain_type != TerrainType.OCEAN
+                downstream_strength < threshold
+                and self.world_gen.get_tile(downstream_q, downstream_r).terrain_type != TerrainType.OCEAN
             ):
                 continue
 
@@ -306,19 +566,63 @@ class WorldMapView:
                 wraps = round((q - downstream_q) / world_width)
                 downstream_q = downstream_q + wraps * world_width
 
-            nx, ny = axial_to_pixel(downstream_q, downstream_r, self.hex_size)
-            nsx, nsy = self._world_to_screen(nx, ny)
+            nsx, nsy = self._world_to_screen(
+                x_per_q * downstream_q + x_per_r * downstream_r,
+                y_per_r * downstream_r,
+            )
             width = max(1, int(min(4, 1 + math.log2(max(1, strength)) / 2)))
-            pygame.draw.line(screen, river_color, (sx, sy), (nsx, nsy), width=width)
+            items.append(((sx, sy), (nsx, nsy), width))
+
+        self._river_overlay = items
+        self._river_overlay_key = overlay_key
+        return items
 
     def _draw_debug_panel(self, screen: pygame.Surface) -> None:
-        panel_rect = pygame.Rect(self.world_width, 0, self.panel_width, self.world_height)
-        pygame.draw.rect(screen, self.panel_bg, panel_rect)
+        # Rebuild the text only when an input changes; ADV shows live cache sizes,
+        # so it is rebuilt every frame.
+        panel_key = (
+            self.debug_verbosity,
+            self.color_mode,
+            self.show_rivers,
+            self.river_threshold,
+            self.player.hex_pos,
+            self.selected_hex,
+            self.hover_hex,
+            self.zoom,
+            self.camera_offset_x,
+            self.camera_offset_y,
+            self.mouse_pixel,
+            self.time_model.local_elapsed_mmss,
+            self.time_model.world_tick_count,
+        )
+        if self.debug_verbosity == "ADV" or panel_key != self._panel_key:
+            self._panel_lines = self._build_panel_lines()
+            self._panel_key = panel_key
+
+        screen.blit(self._panel_surface(tuple(self._panel_lines)), (self.world_width, 0))
+
+    def _panel_surface(self, lines: tuple[str, ...]) -> pygame.Surface:
+        """Return the panel composed onto one surface, re-rendered only when the text changes."""
+        if self._panel_cache is not None and self._panel_cache[0] == lines:
+            return self._panel_cache[1]
 
+        surface = self._panel_bg_surface.copy()
+        surface.blits(
+            [(self._panel_text.line(line), (14, 18 + 24 * idx)) for idx, line in enumerate(lines)],
+            doreturn=False,
+        )
+        # Blank spacer line, then the pre-rendered static controls block.
+        surface.blit(self._controls_surface, (14, 18 + 24 * (len(lines) + 1)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self._panel_cache = (lines, surface)
+        return surface
+
+    def _build_panel_lines(self) -> list[str]:
         travel_cost = self.selected_travel_cost
 
-        hover_tile = None if self.hover_hex is None else self.world_gen.get_tile(*self.hover_hex)
-        selected_tile = None if self.selected_hex is None else self.world_gen.get_tile(*self.selected_hex)
+        hover_tile = None if self.hover_hex is None else self._frame_tile(*self.hover_hex)[0]
+        selected_tile = None if self.selected_hex is None else self._frame_tile(*self.selected_hex)[0]
         hover_climate = self._climate_for_hex(self.hover_hex)
         selected_climate = self._climate_for_hex(self.selected_hex)
 
@@ -414,48 +718,25 @@ class WorldMapView:
                         else "Selected river/lake/flow: (none)"
                     ),
                     f"World tile cache: {len(self.world_gen._tile_cache)}/{self.world_gen._tile_cache_maxsize}",
-                    f"World height cache: {len(self.world_gen._height_cache)}/{self.world_gen._height_cache_maxsize}",
-                    f"World raw-height cache: {len(self.world_gen._raw_height_cache)}/{self.world_gen._raw_height_cache_maxsize}",
+                    f"World height cache: {self.world_gen.cached_height_count()}/{self.world_gen._height_cache_maxsize}",
+                    f"World raw-height cache: {self.world_gen.cached_raw_height_count()}/{self.world_gen._raw_height_cache_maxsize}",
                     (
                         "World boundary cache: "
                         f"{len(self.world_gen._boundary_influence_cache)}/{self.world_gen._boundary_influence_cache_maxsize}"
                     ),
-                    f"Climate cache: {len(self.climate_gen._climate_cache)}/{self.climate_gen._cache_maxsize}",
+                    f"Climate cache: {self.climate_gen.cached_tile_count()}/{self.climate_gen._cache_maxsize}",
                     (
                         "Tectonics plate cache: "
-                        f"{len(self.world_gen._tectonics._plate_cache)}/{self.world_gen._tectonics._cache_maxsize}"
+                        f"{self.world_gen._tectonics.cached_plate_count()}/{self.world_gen._tectonics._cache_maxsize}"
                     ),
                     (
                         "Tectonics boundary cache: "
-                        f"{len(self.world_gen._tectonics._boundary_cache)}/{self.world_gen._tectonics._cache_maxsize}"
+                        f"{self.world_gen._tectonics.cached_boundary_count()}/{self.world_gen._tectonics._cache_maxsize}"
                     ),
                 ]
             )
 
-        lines.extend(
-            [
-                "",
-                "Controls:",
-                "TAB: toggle mode",
-                "F2: debug verbosity",
-                "LMB: select hex",
-                "ENTER/G: travel to selected",
-                "B: toggle biome view",
-                "R: toggle rivers",
-                "[/]: river threshold -/+",
-                "RMB drag: pan",
-                "Wheel: zoom",
-                "F11: toggle fullscreen",
-                "T: world step",
-                "ESC: quit",
-            ]
-        )
-
-        y = 18
-        for line in lines:
-            text_surface = self.font.render(line, True, self.panel_text)
-            screen.blit(text_surface, (self.world_width + 14, y))
-            y += 24
+        return lines
 
     def _apply_zoom(self, factor: float, pivot_screen: tuple[int, int]) -> None:
         old_zoom = self.zoom
@@ -475,3 +756,5 @@ class WorldMapView:
         self.camera_offset_x = px - (world_before_x * scale)
         self.camera_offset_y = py - (world_before_y * scale)
         self.zoom = new_zoom
+        self._last_hover_input = None
+        self._refresh_corner_offsets()
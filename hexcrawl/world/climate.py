@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-import hashlib
-from collections import OrderedDict
 
 from hexcrawl.world.world_config import WorldConfig, default_world_config
-from hexcrawl.world.worldgen import TerrainType
+from hexcrawl.world.worldgen import TERRAIN_TYPES, TerrainType
+
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+
+# Fixed 64-bit salts per noise channel so channels stay decorrelated. Passed to
+# _noise01 as plain ints: no per-sample string or dict lookup.
+_HEAT_MACRO_CHANNEL = 0x78193B9477ED463F
+_HEAT_LOCAL_CHANNEL = 0xE79B2BF8E868B7AA
+_MOISTURE_MACRO_CHANNEL = 0xFFD3C91AA8601618
+_MOISTURE_LOCAL_CHANNEL = 0xC89A8CFA23A58D2D
+_RIDGE_CHANNEL = 0x8941D1622971D58B
+_OCEAN_FETCH_BASIN_CHANNEL = 0xB78553A697BC7472
+_OCEAN_FETCH_DETAIL_CHANNEL = 0x569603581553A1F1
+
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer: full-avalanche mix of a 64-bit integer."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D49BB133111EB1) & _MASK64
+    return x ^ (x >> 31)
 
 
 class BiomeType(str, Enum):
@@ -25,6 +46,17 @@ class BiomeType(str, Enum):
     ALPINE = "ALPINE"
 
 
+BIOME_TYPES: tuple[BiomeType, ...] = tuple(BiomeType)
+_BIOME_IDS: dict[BiomeType, int] = {biome: idx for idx, biome in enumerate(BIOME_TYPES)}
+_TERRAIN_IDS: dict[TerrainType, int] = {terrain: idx for idx, terrain in enumerate(TERRAIN_TYPES)}
+_CELL_UNSET = 0xFF
+_TERRAIN_FIXED_BIOMES: dict[TerrainType, BiomeType] = {
+    TerrainType.OCEAN: BiomeType.OCEAN,
+    TerrainType.COAST: BiomeType.COASTAL,
+}
+_ALPINE_TERRAINS: frozenset[TerrainType] = frozenset((TerrainType.MOUNTAINS, TerrainType.SNOW))
+
+
 @dataclass(frozen=True)
 class ClimateTile:
     """Climate data derived for a single axial coordinate."""
@@ -40,38 +72,149 @@ class ClimateGen:
     def __init__(self, seed: int, config: WorldConfig | None = None) -> None:
         self.seed = int(seed)
         self.config = default_world_config() if config is None else config
+        self._seed_key = self.seed & _MASK64
         self._cache_maxsize = self._resolve_cache_maxsize()
-        self._climate_cache: OrderedDict[tuple[int, int], tuple[TerrainType, float, ClimateTile]] = OrderedDict()
+        # Plain dict with FIFO eviction; hits do no reordering work. Only used when
+        # the world is too large for the dense per-cell arrays below.
+        self._climate_cache: dict[tuple[int, int], tuple[TerrainType, float, ClimateTile]] = {}
+        # Dense structure-of-arrays storage indexed by canonical cell. Each cell also
+        # records the terrain id and height it was computed for, so a hit matches the
+        # dict cache's (terrain, height) check. ClimateTile objects are only built
+        # for single-tile callers; bulk reads go straight to the arrays.
+        self._dense = self.config.width * self.config.height <= self._cache_maxsize
+        cell_count = self.config.width * self.config.height if self._dense else 0
+        self._cell_heat = array("d", bytes(8 * cell_count))
+        self._cell_moisture = array("d", bytes(8 * cell_count))
+        self._cell_biome = bytearray(cell_count)
+        self._cell_terrain = bytearray([_CELL_UNSET]) * cell_count
+        self._cell_height = array("d", bytes(8 * cell_count))
+        self._cell_tiles: list[ClimateTile | None] = [None] * cell_count
+        self._cell_filled = 0
+        # Latitude only depends on the row, so tabulate it once per world height.
+        self._lat_factor: list[float] = [
+            self._compute_latitude_factor(r) for r in range(self.config.r_min, self.config.r_max + 1)
+        ]
+        self._lat_heat: list[float] = [1.0 - latitude for latitude in self._lat_factor]
+        # Per-cell sub-results shared between neighboring tiles' wind scans.
+        self._barrier_cache: dict[tuple[int, int], float] = {}
+        self._ocean_source_cache: dict[tuple[int, int], bool] = {}
         self._fetch_steps = 12
         self._barrier_scan_steps = 6
 
     def get_tile(self, q: int, r: int, terrain_type: TerrainType, height: float) -> ClimateTile:
         """Return deterministic heat/moisture and biome for one hex."""
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
-            return ClimateTile(heat=0.0, moisture=0.0, biome_type=BiomeType.OCEAN)
+        config = self.config
+        if config.q_min <= q <= config.q_max and config.r_min <= r <= config.r_max:
+            # In-bounds coordinates are already canonical.
+            canonical = (q, r)
+        else:
+            canonical = config.canonicalize(q, r)
+            if canonical is None:
+                return ClimateTile(heat=0.0, moisture=0.0, biome_type=BiomeType.OCEAN)
 
         cq, cr = canonical
-        cached_entry = self._climate_cache.get((cq, cr))
-        if cached_entry is not None:
-            cached_terrain, cached_height, cached_tile = cached_entry
-            if cached_terrain == terrain_type and cached_height == height:
-                self._climate_cache.move_to_end((cq, cr))
-                return cached_tile
+        if self._dense:
+            idx = self._fill_cell(cq, cr, terrain_type, height)
+            tile = self._cell_tiles[idx]
+            if tile is None:
+                tile = ClimateTile(
+                    heat=self._cell_heat[idx],
+                    moisture=self._cell_moisture[idx],
+                    biome_type=BIOME_TYPES[self._cell_biome[idx]],
+                )
+                self._cell_tiles[idx] = tile
+            return tile
+
+        cached_entry = self._climate_cache.get(canonical)
+        if cached_entry is not None and cached_entry[0] == terrain_type and cached_entry[1] == height:
+            return cached_entry[2]
+
+        heat, moisture, biome_type = self._compute_climate(cq, cr, terrain_type, height)
+        tile = ClimateTile(heat=heat, moisture=moisture, biome_type=biome_type)
+        cache = self._climate_cache
+        if canonical not in cache and len(cache) >= self._cache_maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del cache[next(iter(cache))]
+        cache[canonical] = (terrain_type, height, tile)
+        return tile
 
-        heat = self._heat_at(cq, cr, height)
-        moisture = self._moisture_at(cq, cr, terrain_type, height)
+    def get_tiles_bulk(
+        self,
+        qs: Sequence[int],
+        rs: Sequence[int],
+        terrains: Sequence[TerrainType],
+        heights: Sequence[float],
+    ) -> tuple[list[float], list[float], bytearray]:
+        """Return heats, moistures and BIOME_TYPES ids for parallel hex sequences.
+
+        Values match get_tile per hex; the batch form lets renderers resolve a
+        whole viewport in one call and map biome ids through a color table.
+        """
+        heats: list[float] = []
+        moistures: list[float] = []
+        biomes = bytearray(len(qs))
+        if not self._dense:
+            get_tile = self.get_tile
+            biome_ids = _BIOME_IDS
+            for idx, (q, r, terrain_type, height) in enumerate(zip(qs, rs, terrains, heights)):
+                tile = get_tile(q, r, terrain_type, height)
+                heats.append(tile.heat)
+                moistures.append(tile.moisture)
+                biomes[idx] = biome_ids[tile.biome_type]
+            return heats, moistures, biomes
+
+        canonicalize = self.config.canonicalize
+        fill_cell = self._fill_cell
+        cell_heat = self._cell_heat
+        cell_moisture = self._cell_moisture
+        cell_biome = self._cell_biome
+        ocean_id = _BIOME_IDS[BiomeType.OCEAN]
+        for out_idx, (q, r, terrain_type, height) in enumerate(zip(qs, rs, terrains, heights)):
+            canonical = canonicalize(q, r)
+            if canonical is None:
+                heats.append(0.0)
+                moistures.append(0.0)
+                biomes[out_idx] = ocean_id
+                continue
+            idx = fill_cell(canonical[0], canonical[1], terrain_type, height)
+            heats.append(cell_heat[idx])
+            moistures.append(cell_moisture[idx])
+            biomes[out_idx] = cell_biome[idx]
+        return heats, moistures, biomes
+
+    def cached_tile_count(self) -> int:
+        """Return how many hexes currently hold cached climate."""
+        return self._cell_filled if self._dense else len(self._climate_cache)
+
+    def _fill_cell(self, q: int, r: int, terrain_type: TerrainType, height: float) -> int:
+        """Ensure the dense cell for canonical (q, r) is current and return its index."""
+        idx = (r - self.config.r_min) * self.config.width + (q - self.config.q_min)
+        terrain_id = _TERRAIN_IDS[terrain_type]
+        previous_terrain = self._cell_terrain[idx]
+        if previous_terrain == terrain_id and self._cell_height[idx] == height:
+            return idx
+
+        heat, moisture, biome_type = self._compute_climate(q, r, terrain_type, height)
+        if previous_terrain == _CELL_UNSET:
+            self._cell_filled += 1
+        self._cell_heat[idx] = heat
+        self._cell_moisture[idx] = moisture
+        self._cell_biome[idx] = _BIOME_IDS[biome_type]
+        self._cell_terrain[idx] = terrain_id
+        self._cell_height[idx] = height
+        self._cell_tiles[idx] = None
+        return idx
+
+    def _compute_climate(
+        self, q: int, r: int, terrain_type: TerrainType, height: float
+    ) -> tuple[float, float, BiomeType]:
+        heat = self._heat_at(q, r, height)
+        moisture = self._moisture_at(q, r, terrain_type, height)
 
         if terrain_type == TerrainType.COAST:
             moisture = min(1.0, moisture + 0.16)
 
-        biome_type = self._biome_for(terrain_type, height, heat, moisture)
-        tile = ClimateTile(heat=heat, moisture=moisture, biome_type=biome_type)
-        self._climate_cache[(cq, cr)] = (terrain_type, height, tile)
-        self._climate_cache.move_to_end((cq, cr))
-        while len(self._climate_cache) > self._cache_maxsize:
-            self._climate_cache.popitem(last=False)
-        return tile
+        return heat, moisture, self._biome_for(terrain_type, height, heat, moisture)
 
     def _resolve_cache_maxsize(self) -> int:
         if self.config.profile.value == "DEV":
@@ -79,16 +222,21 @@ class ClimateGen:
         return 200_000
 
     def _latitude_factor(self, r: int) -> float:
+        row = r - self.config.r_min
+        if 0 <= row < len(self._lat_factor):
+            return self._lat_factor[row]
+        return self._compute_latitude_factor(r)
+
+    def _compute_latitude_factor(self, r: int) -> float:
         center_r = (self.config.r_min + self.config.r_max) / 2.0
         max_dist = max(1.0, (self.config.height - 1) / 2.0)
         return self._clamp01(abs(r - center_r) / max_dist)
 
     def _heat_at(self, q: int, r: int, height: float) -> float:
         # Broad latitudinal pattern with moderate local variation.
-        latitude = self._latitude_factor(r)
-        latitude_heat = 1.0 - latitude
-        macro_noise = self._noise01("heat_macro", q // 4, r // 4)
-        local_noise = self._noise01("heat_local", q, r)
+        latitude_heat = self._lat_heat[r - self.config.r_min]
+        macro_noise = self._noise01(_HEAT_MACRO_CHANNEL, q // 4, r // 4)
+        local_noise = self._noise01(_HEAT_LOCAL_CHANNEL, q, r)
         altitude_cooling = self._clamp01(height) * 0.48
         heat = (latitude_heat * 0.66) + (macro_noise * 0.22) + (local_noise * 0.12)
         return self._clamp01(heat - altitude_cooling)
@@ -112,8 +260,8 @@ class ClimateGen:
     def _moisture_at(self, q: int, r: int, terrain_type: TerrainType, height: float) -> float:
         latitude = self._latitude_factor(r)
         equatorial_band = 1.0 - abs(0.45 - latitude) / 0.45
-        macro_noise = self._noise01("moisture_macro", q // 5, r // 5)
-        local_noise = self._noise01("moisture_local", q, r)
+        macro_noise = self._noise01(_MOISTURE_MACRO_CHANNEL, q // 5, r // 5)
+        local_noise = self._noise01(_MOISTURE_LOCAL_CHANNEL, q, r)
         moisture = (self._clamp01(equatorial_band) * 0.42) + (macro_noise * 0.35) + (local_noise * 0.23)
 
         wind_dir = self._wind_dir(r)
@@ -144,37 +292,64 @@ class ClimateGen:
         return 0.0
 
     def _orographic_barrier(self, q: int, r: int) -> float:
-        ridge_noise = self._noise01("ridge", q, r)
-        return self._clamp01((ridge_noise - 0.58) / 0.42)
+        # Each cell is scanned by up to 2 * _barrier_scan_steps neighbors; memoize it.
+        barrier = self._barrier_cache.get((q, r))
+        if barrier is None:
+            ridge_noise = self._noise01(_RIDGE_CHANNEL, q, r)
+            barrier = self._clamp01((ridge_noise - 0.58) / 0.42)
+            self._memo_set(self._barrier_cache, (q, r), barrier)
+        return barrier
 
     def _scan_barrier_strength(self, q: int, r: int, direction: int) -> float:
         strongest = 0.0
-        for step in range(1, self._barrier_scan_steps + 1):
-            wrapped = self.config.canonicalize(q + (step * direction), r)
-            if wrapped is None:
-                break
-            sq, sr = wrapped
-            barrier = self._orographic_barrier(sq, sr)
+        for step, sq in enumerate(self._row_scan_qs(q, r, direction, self._barrier_scan_steps), start=1):
+            barrier = self._orographic_barrier(sq, r)
             decayed = barrier * (1.0 - (0.12 * (step - 1)))
             strongest = max(strongest, decayed)
         return self._clamp01(strongest)
 
     def _ocean_fetch_bonus(self, q: int, r: int, wind_dir: int) -> float:
-        for step in range(1, self._fetch_steps + 1):
-            # Upwind sampling: opposite to travel direction.
-            wrapped = self.config.canonicalize(q - (step * wind_dir), r)
-            if wrapped is None:
-                break
-            sq, sr = wrapped
-            if self._is_ocean_source_tile(sq, sr):
+        # Upwind sampling: opposite to travel direction.
+        for step, sq in enumerate(self._row_scan_qs(q, r, -wind_dir, self._fetch_steps), start=1):
+            if self._is_ocean_source_tile(sq, r):
                 proximity = 1.0 - ((step - 1) / self._fetch_steps)
                 return 0.24 * proximity
         return 0.0
 
+    def _row_scan_qs(self, q: int, r: int, dq: int, steps: int) -> list[int]:
+        """Canonical q of the cells q + dq * step (step = 1..steps) along row r.
+
+        Equivalent to canonicalizing each cell and stopping at the first None, with
+        the row check and x-wrap hoisted out of the per-step work.
+        """
+        config = self.config
+        if not config.is_r_in_bounds(r):
+            return []
+        q_min = config.q_min
+        if config.wrap_x:
+            width = config.width
+            return [((q + dq * step - q_min) % width) + q_min for step in range(1, steps + 1)]
+        q_max = config.q_max
+        scan: list[int] = []
+        for step in range(1, steps + 1):
+            sq = q + dq * step
+            if sq < q_min or sq > q_max:
+                break
+            scan.append(sq)
+        return scan
+
     def _is_ocean_source_tile(self, q: int, r: int) -> bool:
+        # Shared by the upwind fetch scans of up to _fetch_steps tiles; memoize it.
+        is_source = self._ocean_source_cache.get((q, r))
+        if is_source is None:
+            is_source = self._compute_is_ocean_source_tile(q, r)
+            self._memo_set(self._ocean_source_cache, (q, r), is_source)
+        return is_source
+
+    def _compute_is_ocean_source_tile(self, q: int, r: int) -> bool:
         latitude = self._latitude_factor(r)
-        basin_noise = self._noise01("ocean_fetch_basin", q // 3, r // 2)
-        detail_noise = self._noise01("ocean_fetch_detail", q, r)
+        basin_noise = self._noise01(_OCEAN_FETCH_BASIN_CHANNEL, q // 3, r // 2)
+        detail_noise = self._noise01(_OCEAN_FETCH_DETAIL_CHANNEL, q, r)
         threshold = 0.5 + (abs(0.5 - latitude) * 0.12)
         ocean_score = (basin_noise * 0.7) + (detail_noise * 0.3)
         return ocean_score >= threshold
@@ -186,11 +361,11 @@ class ClimateGen:
         heat: float,
         moisture: float,
     ) -> BiomeType:
-        if terrain_type == TerrainType.OCEAN:
-            return BiomeType.OCEAN
-        if terrain_type == TerrainType.COAST:
-            return BiomeType.COASTAL
-        if terrain_type in (TerrainType.MOUNTAINS, TerrainType.SNOW) and (height > 0.9 or heat < 0.25):
+        # Terrain-decided biomes come from tables; only the climate ladder branches.
+        fixed_biome = _TERRAIN_FIXED_BIOMES.get(terrain_type)
+        if fixed_biome is not None:
+            return fixed_biome
+        if terrain_type in _ALPINE_TERRAINS and (height > 0.9 or heat < 0.25):
             return BiomeType.ALPINE
         if heat < 0.22:
             return BiomeType.TUNDRA
@@ -204,11 +379,15 @@ class ClimateGen:
             return BiomeType.TEMPERATE_FOREST
         return BiomeType.GRASSLAND
 
-    def _noise01(self, channel: str, q: int, r: int) -> float:
-        msg = f"{self.seed}:{channel}:{q}:{r}".encode("utf-8")
-        digest = hashlib.blake2b(msg, digest_size=8).digest()
-        raw = int.from_bytes(digest, byteorder="big", signed=False)
-        return raw / float((1 << 64) - 1)
+    def _noise01(self, channel: int, q: int, r: int) -> float:
+        coord_key = _mix64((((q & _MASK64) * _GOLDEN64) ^ (r & _MASK64)) & _MASK64)
+        raw = _mix64(self._seed_key ^ channel ^ coord_key)
+        return raw / float(_MASK64)
+
+    def _memo_set(self, memo: dict, key: tuple[int, int], value: object) -> None:
+        if len(memo) >= self._cache_maxsize:
+            memo.clear()
+        memo[key] = value
 
     @staticmethod
     def _clamp01(value: float) -> float:
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from array import array
 
-from hexcrawl.core.hex_math import AXIAL_DIRECTIONS
+from hexcrawl.core.hex_math import AXIAL_DIRECTIONS, axial_neighbor_strides
 from hexcrawl.world.world_config import WorldConfig
 
 
@@ -24,8 +24,13 @@ class ErosionModel:
         self._flow_to_fn = flow_to_fn
 
         self._cache_maxsize = self._resolve_cache_maxsize()
-        self._height_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
-        self._valley_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
+        self._height_cache: dict[int, float] = {}
+        self._valley_cache: dict[int, float] = {}
+        # Worlds within the cache budget are eroded in one whole-grid pass into
+        # row-major arrays (WorldConfig.index) on first use.
+        self._dense = config.width * config.height <= self._cache_maxsize
+        self._eroded_heights = array("d")
+        self._valley_strengths = array("d")
 
         # WG-6 tuning: lightweight, deterministic visual polish.
         self._carving_threshold = 180
@@ -33,15 +38,19 @@ class ErosionModel:
         self._neighbor_relax_weight = 0.24
 
     def eroded_height(self, q: int, r: int) -> float:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return 0.0
+        if self._dense:
+            if not self._eroded_heights:
+                self._build_all()
+            return self._eroded_heights[key]
 
-        cached = self._cache_get(self._height_cache, canonical)
+        cached = self._cache_get(self._height_cache, key)
         if cached is not None:
             return cached
 
-        cq, cr = canonical
+        cq, cr = self.config.decode(key)
         center_carved = self._carved_height_at(cq, cr)
 
         neighbor_values: list[float] = []
@@ -60,22 +69,69 @@ class ErosionModel:
             polished = center_carved
 
         clamped = max(0.0, min(1.0, polished))
-        self._cache_set(self._height_cache, canonical, clamped, self._cache_maxsize)
+        self._cache_set(self._height_cache, key, clamped, self._cache_maxsize)
         return clamped
 
     def valley_strength(self, q: int, r: int) -> float:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return 0.0
+        if self._dense:
+            if not self._valley_strengths:
+                self._build_all()
+            return self._valley_strengths[key]
 
-        cached = self._cache_get(self._valley_cache, canonical)
+        cached = self._cache_get(self._valley_cache, key)
         if cached is not None:
             return cached
 
-        strength = self._valley_strength_at(*canonical)
-        self._cache_set(self._valley_cache, canonical, strength, self._cache_maxsize)
+        strength = self._valley_strength_at(*self.config.decode(key))
+        self._cache_set(self._valley_cache, key, strength, self._cache_maxsize)
         return strength
 
+    def _build_all(self) -> None:
+        """Carve and polish the whole grid with flat index arithmetic.
+
+        Each cell's valley strength and carved height is computed once, then the
+        neighbor polish reads the carved array instead of re-carving the six
+        neighbors of every cell. Neighbors are summed in AXIAL_DIRECTIONS order,
+        so results match the per-tile path bit for bit.
+        """
+        config = self.config
+        width = config.width
+        base_height_fn = self._base_height_fn
+        valley_strength_at = self._valley_strength_at
+
+        valleys = array("d")
+        carved = array("d")
+        for r in range(config.r_min, config.r_max + 1):
+            for q in range(config.q_min, config.q_max + 1):
+                valley = valley_strength_at(q, r)
+                valleys.append(valley)
+                carved.append(max(0.0, min(1.0, base_height_fn(q, r) - valley)))
+
+        relax = self._neighbor_relax_weight
+        keep = 1.0 - relax
+        eroded = array("d", bytes(8 * len(carved)))
+        row_strides = axial_neighbor_strides(width, config.height, config.wrap_x)
+        last_col = width - 1
+        idx = 0
+        for row in range(config.height):
+            first, interior, last = row_strides[row]
+            for col in range(width):
+                strides = interior if 0 < col < last_col else (first if col == 0 else last)
+                total = 0.0
+                for stride in strides:
+                    total += carved[idx + stride]
+
+                center = carved[idx]
+                polished = (center * keep) + ((total / len(strides)) * relax) if strides else center
+                eroded[idx] = max(0.0, min(1.0, polished))
+                idx += 1
+
+        self._valley_strengths = valleys
+        self._eroded_heights = eroded
+
     def _carved_height_at(self, q: int, r: int) -> float:
         base = self._base_height_fn(q, r)
         carved = base - self.valley_strength(q, r)
@@ -102,21 +158,21 @@ class ErosionModel:
         return 200_000
 
     @staticmethod
-    def _cache_get(cache: OrderedDict[tuple[int, int], object], key: tuple[int, int]) -> object | None:
-        value = cache.get(key)
+    def _cache_get(cache: dict[int, object], key: int) -> object | None:
+        value = cache.pop(key, None)
         if value is None:
             return None
-        cache.move_to_end(key)
+        cache[key] = value
         return value
 
     @staticmethod
     def _cache_set(
-        cache: OrderedDict[tuple[int, int], object],
-        key: tuple[int, int],
+        cache: dict[int, object],
+        key: int,
         value: object,
         maxsize: int,
     ) -> None:
+        cache.pop(key, None)
         cache[key] = value
-        cache.move_to_end(key)
         while len(cache) > maxsize:
-            cache.popitem(last=False)
+            del cache[next(iter(cache))]
@@ -2,18 +2,201 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from array import array
 from math import inf
+from typing import NamedTuple
 
-from hexcrawl.core.hex_math import AXIAL_DIRECTIONS
+from hexcrawl.core.hex_math import axial_neighbor_strides
 from hexcrawl.world.world_config import WorldConfig
 
 
+_NO_FLOW = -1
+_SINK = -2
+
+
+def _compute_flow_dirs(
+    heights: list[float],
+    is_ocean: bytearray,
+    width: int,
+    height: int,
+    wrap_x: bool,
+) -> list[int]:
+    """Return each cell's steepest-descent neighbor index over a flat row-major grid.
+
+    Ocean cells get _NO_FLOW; land cells without a strictly lower neighbor get
+    _SINK so the caller can resolve an overflow outlet. Neighbors are visited in
+    AXIAL_DIRECTIONS order, so ties resolve exactly like the per-tile path.
+    Heights are compared as exact floats: quantizing them (e.g. to uint16) turns
+    near-equal neighbors into ties and reroutes rivers.
+    """
+    flow = [_NO_FLOW] * (width * height)
+    row_strides = axial_neighbor_strides(width, height, wrap_x)
+    last_col = width - 1
+    idx = 0
+    for row in range(height):
+        first, interior, last = row_strides[row]
+        for col in range(width):
+            if is_ocean[idx]:
+                idx += 1
+                continue
+
+            best_idx = _SINK
+            best_height = heights[idx]
+            for stride in interior if 0 < col < last_col else (first if col == 0 else last):
+                n_idx = idx + stride
+                n_height = heights[n_idx]
+                if n_height < best_height:
+                    best_height = n_height
+                    best_idx = n_idx
+            flow[idx] = best_idx
+            idx += 1
+    return flow
+
+
+def _overflow_step(
+    source: int,
+    sink_height: float,
+    heights: list[float],
+    is_ocean: bytearray,
+    width: int,
+    row_strides: list[tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]],
+    radius: int,
+    col_keys: list[int] | None = None,
+) -> int:
+    """Return the first step from a sink toward its overflow outlet, or _NO_FLOW.
+
+    Breadth-first search up to `radius` hops for the lowest cell below the sink
+    (ocean ranks as -inf), with ties broken by hop distance and then (q, r).
+    `col_keys` maps grid columns to world columns when the grid is a window whose
+    columns wrap, so ties still order by canonical q. `row_strides` comes from
+    axial_neighbor_strides for the grid; callers build it once for all sinks.
+    """
+    last_col = width - 1
+    queue = [source]
+    distance = {source: 0}
+    parent: dict[int, int] = {}
+    best: tuple[float, int, int, int] | None = None
+    best_idx = _NO_FLOW
+
+    head = 0
+    while head < len(queue):
+        idx = queue[head]
+        head += 1
+        dist = distance[idx]
+        if dist >= radius:
+            continue
+
+        row, col = divmod(idx, width)
+        first, interior, last = row_strides[row]
+        for stride in interior if 0 < col < last_col else (first if col == 0 else last):
+            n_idx = idx + stride
+            if n_idx in distance:
+                continue
+
+            distance[n_idx] = dist + 1
+            parent[n_idx] = idx
+            queue.append(n_idx)
+
+            if is_ocean[n_idx]:
+                outlet_height = -inf
+            else:
+                outlet_height = heights[n_idx]
+                if outlet_height >= sink_height:
+                    continue
+
+            n_row, n_col = divmod(n_idx, width)
+            rank = (outlet_height, dist + 1, n_col if col_keys is None else col_keys[n_col], n_row)
+            if best is None or rank < best:
+                best = rank
+                best_idx = n_idx
+
+    if best is None:
+        return _NO_FLOW
+
+    step = best_idx
+    while parent[step] != source:
+        step = parent[step]
+    return step
+
+
+def _break_cycles(flow: list[int]) -> None:
+    """Cut any flow cycles in place by turning the closing edge into _NO_FLOW.
+
+    Each cell has at most one downstream edge, so the depth-first search is a
+    plain walk: follow the chain marking cells in-progress until it reaches a
+    finished cell, the end of the flow, or an in-progress cell (a cycle). No
+    recursion, so arbitrarily long rivers are safe.
+    """
+    state = bytearray(len(flow))
+    path: list[int] = []
+
+    for start in range(len(flow)):
+        if state[start]:
+            continue
+        idx = start
+        while True:
+            state[idx] = 1
+            path.append(idx)
+            nxt = flow[idx]
+            if nxt < 0:
+                break
+            nxt_state = state[nxt]
+            if nxt_state == 1:
+                flow[idx] = _NO_FLOW
+                break
+            if nxt_state == 2:
+                break
+            idx = nxt
+        for idx in path:
+            state[idx] = 2
+        path.clear()
+
+
+def _accumulate(flow: list[int], is_ocean: bytearray) -> list[int]:
+    """Return upstream cell counts (land cells count 1) for an acyclic flat flow field.
+
+    In-degree frontier sweep: cells with no remaining upstream inflow push their
+    total downstream, so every cell is visited once with no recursion depth limit.
+    """
+    accum = [0 if ocean else 1 for ocean in is_ocean]
+    in_degree = [0] * len(flow)
+    for downstream_idx in flow:
+        if downstream_idx >= 0:
+            in_degree[downstream_idx] += 1
+
+    frontier = [idx for idx, degree in enumerate(in_degree) if degree == 0]
+    while frontier:
+        idx = frontier.pop()
+        downstream_idx = flow[idx]
+        if downstream_idx < 0:
+            continue
+        accum[downstream_idx] += accum[idx]
+        in_degree[downstream_idx] -= 1
+        if in_degree[downstream_idx] == 0:
+            frontier.append(downstream_idx)
+    return accum
+
+
+class RiverBlock(NamedTuple):
+    """River data for an inclusive axial block, row-major: (q, r) sits at (r - r0) * (q1 - q0 + 1) + (q - q0)."""
+
+    strength: list[int]
+    flow_to: list[tuple[int, int] | None]
+    lake: list[bool]
+
+
 class HydrologyModel:
     """Caches wrap-safe flow direction, accumulation, and lake data.
 
-    Assumption: TARGET-sized worlds currently skip global hydrology prebuild when
-    caches are capped below world_size. Chunked hydrology is future work.
+    Worlds within the cache budget are solved globally in one pass. Capped
+    (TARGET) worlds resolve flow and lakes per config.chunk_size tile, over a
+    window padded by the overflow radius so results match the global kernels;
+    accumulation and river strength need the whole drainage basin and stay 0 there.
+
+    Heights are not cached here; height_fn is expected to read a shared store
+    (WorldGen's base-height array) so erosion and hydrology sample it once.
+    When ocean is just a height threshold, pass ocean_threshold instead of
+    is_ocean_fn and the flags are derived from the heights already read.
     """
 
     def __init__(
@@ -21,61 +204,126 @@ class HydrologyModel:
         seed: int,
         config: WorldConfig,
         height_fn,
-        is_ocean_fn,
+        is_ocean_fn=None,
         overflow_radius: int = 10,
+        ocean_threshold: float | None = None,
     ) -> None:
+        if (is_ocean_fn is None) == (ocean_threshold is None):
+            raise ValueError("pass exactly one of is_ocean_fn or ocean_threshold")
         self.seed = int(seed)
         self.config = config
         self._height_fn = height_fn
         self._is_ocean_fn = is_ocean_fn
+        self._ocean_threshold = ocean_threshold
 
         self._cache_maxsize = self._resolve_cache_maxsize()
         self._overflow_radius = max(1, int(overflow_radius))
         self._supports_global_build = (self.config.width * self.config.height) <= self._cache_maxsize
-        self._flow_cache: OrderedDict[tuple[int, int], tuple[int, int] | None] = OrderedDict()
-        self._accumulation_cache: OrderedDict[tuple[int, int], int] = OrderedDict()
-        self._river_strength_cache: OrderedDict[tuple[int, int], int] = OrderedDict()
-        self._lake_cache: OrderedDict[tuple[int, int], bool] = OrderedDict()
-        self._height_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
+        # Worlds that fit the cache budget are solved in one pass into dense
+        # row-major arrays (WorldConfig.index); flow entries are the downstream
+        # cell index or _NO_FLOW.
+        self._flow = array("i")
+        self._accumulation = array("i")
+        self._river_strength = array("i")
+        self._lake = bytearray()
+        # Capped (TARGET) worlds solve tiles on demand into a bounded cache of
+        # (downstream indices, lake flags) per chunk, keyed by (chunk_row, chunk_col).
+        tile_w, tile_h = self.config.chunk_size
+        self._chunk_cache: dict[tuple[int, int], tuple[array, bytearray]] = {}
+        self._chunk_cache_maxsize = max(1, self._cache_maxsize // (tile_w * tile_h))
         self._built = False
 
     def flow_to(self, q: int, r: int) -> tuple[int, int] | None:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return None
         self._ensure_built()
-        if not self._supports_global_build and canonical not in self._flow_cache:
-            self._cache_set(
-                self._flow_cache,
-                canonical,
-                self._resolve_flow(canonical[0], canonical[1], heights={}),
-                self._cache_maxsize,
-            )
-        return self._flow_cache.get(canonical)
+        if self._supports_global_build:
+            downstream_idx = self._flow[key]
+        else:
+            flows, _ = self._chunk_for(key)
+            downstream_idx = flows[self._chunk_offset(key)]
+        return None if downstream_idx < 0 else self.config.decode(downstream_idx)
 
     def accumulation(self, q: int, r: int) -> int:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return 0
         self._ensure_built()
-        return self._accumulation_cache.get(canonical, 0)
+        return self._accumulation[key] if self._supports_global_build else 0
 
     def river_strength(self, q: int, r: int) -> int:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return 0
         self._ensure_built()
-        return self._river_strength_cache.get(canonical, 0)
+        return self._river_strength[key] if self._supports_global_build else 0
 
     def is_lake(self, q: int, r: int) -> bool:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return False
         self._ensure_built()
-        if not self._supports_global_build and canonical not in self._lake_cache:
-            is_lake = (not self._is_ocean_fn(*canonical)) and self.flow_to(*canonical) is None
-            self._cache_set(self._lake_cache, canonical, is_lake, self._cache_maxsize)
-        return self._lake_cache.get(canonical, False)
+        if self._supports_global_build:
+            return bool(self._lake[key])
+        _, lakes = self._chunk_for(key)
+        return bool(lakes[self._chunk_offset(key)])
+
+    def river_block(self, q0: int, r0: int, q1: int, r1: int) -> RiverBlock:
+        """Return river strength, flow target and lake flags for an inclusive axial block.
+
+        Globally solved worlds slice the dense arrays per row; capped worlds fall
+        back to per-hex queries. Off-world hexes read as no river, no flow, no lake.
+        """
+        self._ensure_built()
+        if not self._supports_global_build:
+            block = [(q, r) for r in range(r0, r1 + 1) for q in range(q0, q1 + 1)]
+            return RiverBlock(
+                strength=[self.river_strength(q, r) for q, r in block],
+                flow_to=[self.flow_to(q, r) for q, r in block],
+                lake=[self.is_lake(q, r) for q, r in block],
+            )
+
+        config = self.config
+        width = config.width
+        block_width = q1 - q0 + 1
+        col0 = q0 - config.q_min
+        col1 = col0 + block_width
+        # Blocks inside the world's columns slice each row directly; others gather
+        # wrapped columns (or -1 for off-world columns without x-wrap).
+        contiguous = 0 <= col0 and col1 <= width
+        if not contiguous:
+            if config.wrap_x:
+                cols = [col % width for col in range(col0, col1)]
+            else:
+                cols = [col if 0 <= col < width else -1 for col in range(col0, col1)]
+
+        river_strength = self._river_strength
+        flow = self._flow
+        lake = self._lake
+        decode = config.decode
+        strengths: list[int] = []
+        flows: list[tuple[int, int] | None] = []
+        lakes: list[bool] = []
+        for r in range(r0, r1 + 1):
+            if not config.r_min <= r <= config.r_max:
+                strengths.extend([0] * block_width)
+                flows.extend([None] * block_width)
+                lakes.extend([False] * block_width)
+                continue
+            base = (r - config.r_min) * width
+            if contiguous:
+                row_strength = river_strength[base + col0 : base + col1]
+                row_flow = flow[base + col0 : base + col1]
+                row_lake = lake[base + col0 : base + col1]
+            else:
+                row_strength = [0 if col < 0 else river_strength[base + col] for col in cols]
+                row_flow = [_NO_FLOW if col < 0 else flow[base + col] for col in cols]
+                row_lake = [0 if col < 0 else lake[base + col] for col in cols]
+            strengths.extend(row_strength)
+            flows.extend(None if downstream_idx < 0 else decode(downstream_idx) for downstream_idx in row_flow)
+            lakes.extend(map(bool, row_lake))
+        return RiverBlock(strength=strengths, flow_to=flows, lake=lakes)
 
     def _ensure_built(self) -> None:
         if self._built:
@@ -87,164 +335,135 @@ class HydrologyModel:
         self._built = True
 
     def _build_all(self) -> None:
-        nodes: list[tuple[int, int]] = []
-        heights: dict[tuple[int, int], float] = {}
-
-        for r in range(self.config.r_min, self.config.r_max + 1):
-            for q in range(self.config.q_min, self.config.q_max + 1):
-                coord = (q, r)
-                nodes.append(coord)
-                heights[coord] = self._height_fn(q, r)
-
-        for q, r in nodes:
-            self._cache_set(self._flow_cache, (q, r), self._resolve_flow(q, r, heights), self._cache_maxsize)
-
-        self._break_cycles(nodes)
-
-        base: dict[tuple[int, int], int] = {coord: 0 if self._is_ocean_fn(*coord) else 1 for coord in nodes}
-        upstreams: dict[tuple[int, int], list[tuple[int, int]]] = {coord: [] for coord in nodes}
-        for coord in nodes:
-            downstream = self._flow_cache[coord]
-            if downstream is not None:
-                upstreams[downstream].append(coord)
-
-        accum: dict[tuple[int, int], int] = {}
-
-        def compute(coord: tuple[int, int]) -> int:
-            if coord in accum:
-                return accum[coord]
-            total = base[coord]
-            for upstream in upstreams[coord]:
-                total += compute(upstream)
-            accum[coord] = total
-            return total
-
-        for coord in nodes:
-            compute(coord)
-
-        for coord in nodes:
-            is_ocean = self._is_ocean_fn(*coord)
-            strength = 0 if is_ocean else accum[coord]
-            self._cache_set(self._accumulation_cache, coord, accum[coord], self._cache_maxsize)
-            self._cache_set(self._river_strength_cache, coord, strength, self._cache_maxsize)
-            self._cache_set(
-                self._lake_cache,
-                coord,
-                (not is_ocean) and self._flow_cache[coord] is None,
-                self._cache_maxsize,
-            )
-
-    def _break_cycles(self, nodes: list[tuple[int, int]]) -> None:
-        state: dict[tuple[int, int], int] = {}
-
-        def dfs(coord: tuple[int, int]) -> None:
-            state[coord] = 1
-            nxt = self._flow_cache.get(coord)
-            if nxt is not None:
-                nxt_state = state.get(nxt, 0)
-                if nxt_state == 0:
-                    dfs(nxt)
-                elif nxt_state == 1:
-                    self._cache_set(self._flow_cache, coord, None, self._cache_maxsize)
-            state[coord] = 2
-
-        for coord in nodes:
-            if state.get(coord, 0) == 0:
-                dfs(coord)
-
-    def _resolve_flow(
-        self,
-        q: int,
-        r: int,
-        heights: dict[tuple[int, int], float],
-    ) -> tuple[int, int] | None:
-        if self._is_ocean_fn(q, r):
-            return None
-
-        current = self._height_at(q, r, heights)
-        best_neighbor: tuple[int, int] | None = None
-        best_height = current
-
-        for dq, dr in AXIAL_DIRECTIONS:
-            neighbor = self.config.canonicalize(q + dq, r + dr)
-            if neighbor is None:
-                continue
-            neighbor_height = self._height_at(neighbor[0], neighbor[1], heights)
-            if neighbor_height < best_height:
-                best_height = neighbor_height
-                best_neighbor = neighbor
-
-        if best_neighbor is not None:
-            return best_neighbor
-        return self._resolve_overflow(q, r, current, heights)
-
-    def _resolve_overflow(
-        self,
-        q: int,
-        r: int,
-        sink_height: float,
-        heights: dict[tuple[int, int], float],
-    ) -> tuple[int, int] | None:
-        source = (q, r)
-        queue: list[tuple[int, int]] = [source]
-        distance: dict[tuple[int, int], int] = {source: 0}
-        parent: dict[tuple[int, int], tuple[int, int]] = {}
-        best: tuple[float, int, int, int] | None = None
-        best_coord: tuple[int, int] | None = None
-
-        idx = 0
-        while idx < len(queue):
-            coord = queue[idx]
-            idx += 1
-            dist = distance[coord]
-            if dist >= self._overflow_radius:
-                continue
-
-            for dq, dr in AXIAL_DIRECTIONS:
-                neighbor = self.config.canonicalize(coord[0] + dq, coord[1] + dr)
-                if neighbor is None or neighbor in distance:
-                    continue
-
-                distance[neighbor] = dist + 1
-                parent[neighbor] = coord
-                queue.append(neighbor)
-
-                outlet_height = self._height_at(neighbor[0], neighbor[1], heights)
-                if self._is_ocean_fn(*neighbor):
-                    outlet_height = -inf
-                elif outlet_height >= sink_height:
-                    continue
-
-                rank = (outlet_height, distance[neighbor], neighbor[0], neighbor[1])
-                if best is None or rank < best:
-                    best = rank
-                    best_coord = neighbor
-
-        if best_coord is None:
-            return None
-
-        step = best_coord
-        while parent.get(step) and parent[step] != source:
-            step = parent[step]
-        return step
-
-    def _height_at(
-        self,
-        q: int,
-        r: int,
-        heights: dict[tuple[int, int], float],
-    ) -> float:
-        coord = (q, r)
-        if coord in heights:
-            return heights[coord]
-        if coord in self._height_cache:
-            value = self._height_cache[coord]
-            self._height_cache.move_to_end(coord)
-            return value
-        value = self._height_fn(q, r)
-        self._cache_set(self._height_cache, coord, value, self._cache_maxsize)
-        heights[coord] = value
-        return value
+        config = self.config
+        width = config.width
+        nodes: list[tuple[int, int]] = [
+            (q, r)
+            for r in range(config.r_min, config.r_max + 1)
+            for q in range(config.q_min, config.q_max + 1)
+        ]
+        # Each node's height and ocean flag is evaluated exactly once; the kernels
+        # below work on flat row-major arrays indexed like `nodes`. Row-major order
+        # is deliberate: 64x64 tiled traversal measured no faster here, since
+        # interpreter overhead, not memory locality, bounds these loops.
+        height_values = [self._height_fn(q, r) for q, r in nodes]
+        is_ocean = self._ocean_flags(height_values, nodes)
+
+        flow = _compute_flow_dirs(height_values, is_ocean, width, config.height, config.wrap_x)
+        row_strides = axial_neighbor_strides(width, config.height, config.wrap_x)
+        for idx, downstream_idx in enumerate(flow):
+            if downstream_idx == _SINK:
+                flow[idx] = _overflow_step(
+                    idx,
+                    height_values[idx],
+                    height_values,
+                    is_ocean,
+                    width,
+                    row_strides,
+                    self._overflow_radius,
+                )
+
+        _break_cycles(flow)
+        accum = _accumulate(flow, is_ocean)
+
+        self._flow = array("i", flow)
+        self._accumulation = array("i", accum)
+        self._river_strength = array("i", (0 if ocean else total for ocean, total in zip(is_ocean, accum)))
+        self._lake = bytearray((not ocean) and downstream_idx < 0 for ocean, downstream_idx in zip(is_ocean, flow))
+
+    def _chunk_offset(self, key: int) -> int:
+        tile_w, tile_h = self.config.chunk_size
+        row, col = divmod(key, self.config.width)
+        return (row % tile_h) * tile_w + (col % tile_w)
+
+    def _chunk_for(self, key: int) -> tuple[array, bytearray]:
+        tile_w, tile_h = self.config.chunk_size
+        row, col = divmod(key, self.config.width)
+        chunk_key = (row // tile_h, col // tile_w)
+        chunk = self._chunk_cache.get(chunk_key)
+        if chunk is None:
+            chunk = self._solve_chunk(*chunk_key)
+        self._cache_set(self._chunk_cache, chunk_key, chunk, self._chunk_cache_maxsize)
+        return chunk
+
+    def _ocean_flags(self, heights: list[float], coords: list[tuple[int, int]]) -> bytearray:
+        """Ocean flags aligned with `heights`/`coords`, one byte per cell."""
+        threshold = self._ocean_threshold
+        if threshold is not None:
+            return bytearray(height < threshold for height in heights)
+        is_ocean_fn = self._is_ocean_fn
+        return bytearray(bool(is_ocean_fn(q, r)) for q, r in coords)
+
+    def _solve_chunk(self, chunk_row: int, chunk_col: int) -> tuple[array, bytearray]:
+        """Resolve downstream indices and lake flags for one chunk_size tile.
+
+        Heights are sampled over the tile plus an overflow-radius halo, so every
+        neighbor and overflow search of an interior cell stays inside the window
+        and the flat kernels give the same answer as a global build (minus cycle
+        breaking, which needs the whole flow graph). Tiles are stored row-major
+        at the full chunk stride; slots past the world edge stay _NO_FLOW.
+        """
+        config = self.config
+        width = config.width
+        tile_w, tile_h = config.chunk_size
+        halo = self._overflow_radius
+
+        row0 = chunk_row * tile_h
+        row1 = min(row0 + tile_h, config.height)
+        col0 = chunk_col * tile_w
+        col1 = min(col0 + tile_w, width)
+        win_row0 = max(0, row0 - halo)
+        win_row1 = min(config.height, row1 + halo)
+        if config.wrap_x and (col1 - col0) + 2 * halo >= width:
+            # The padded window spans the world, so use whole rows and wrap them.
+            cols = list(range(width))
+            win_col0 = 0
+            win_wrap = True
+        elif config.wrap_x:
+            cols = [col % width for col in range(col0 - halo, col1 + halo)]
+            win_col0 = col0 - halo
+            win_wrap = False
+        else:
+            win_col0 = max(0, col0 - halo)
+            cols = list(range(win_col0, min(width, col1 + halo)))
+            win_wrap = False
+        win_w = len(cols)
+        win_h = win_row1 - win_row0
+
+        height_fn = self._height_fn
+        q_values = [col + config.q_min for col in cols]
+        coords = [(q, row + config.r_min) for row in range(win_row0, win_row1) for q in q_values]
+        heights = [height_fn(q, r) for q, r in coords]
+        is_ocean = self._ocean_flags(heights, coords)
+
+        flow = _compute_flow_dirs(heights, is_ocean, win_w, win_h, win_wrap)
+        row_strides = axial_neighbor_strides(win_w, win_h, win_wrap)
+
+        flows = array("i", [_NO_FLOW]) * (tile_w * tile_h)
+        lakes = bytearray(tile_w * tile_h)
+        for row in range(row0, row1):
+            win_base = (row - win_row0) * win_w
+            tile_base = (row - row0) * tile_w
+            for col in range(col0, col1):
+                win_idx = win_base + (col - win_col0)
+                downstream = flow[win_idx]
+                if downstream == _SINK:
+                    downstream = _overflow_step(
+                        win_idx,
+                        heights[win_idx],
+                        heights,
+                        is_ocean,
+                        win_w,
+                        row_strides,
+                        halo,
+                        cols,
+                    )
+                if downstream >= 0:
+                    win_row, win_col = divmod(downstream, win_w)
+                    flows[tile_base + (col - col0)] = (win_row0 + win_row) * width + cols[win_col]
+                elif not is_ocean[win_idx]:
+                    lakes[tile_base + (col - col0)] = 1
+        return flows, lakes
 
     def _resolve_cache_maxsize(self) -> int:
         if self.config.profile.value == "DEV":
@@ -253,12 +472,12 @@ class HydrologyModel:
 
     @staticmethod
     def _cache_set(
-        cache: OrderedDict[tuple[int, int], object],
+        cache: dict[tuple[int, int], object],
         key: tuple[int, int],
         value: object,
         maxsize: int,
     ) -> None:
+        cache.pop(key, None)
         cache[key] = value
-        cache.move_to_end(key)
         while len(cache) > maxsize:
-            cache.popitem(last=False)
+            del cache[next(iter(cache))]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import hashlib
-from collections import OrderedDict
+from math import isqrt
 from dataclasses import dataclass
 from enum import Enum
 
@@ -36,6 +36,23 @@ class BoundaryData:
     strength: float
 
 
+_NO_BOUNDARY = BoundaryData(kind=BoundaryKind.NONE, strength=0.0)
+# Plate counts are capped at 96, so per-cell plate ids fit in a byte.
+_PLATE_UNSET = 0xFF
+
+
+def _ring_keys(bx: int, by: int, ring: int) -> list[tuple[int, int]]:
+    """Bucket keys at Chebyshev distance `ring` from (bx, by)."""
+    if ring == 0:
+        return [(bx, by)]
+    keys = [(x, by - ring) for x in range(bx - ring, bx + ring + 1)]
+    keys.extend((x, by + ring) for x in range(bx - ring, bx + ring + 1))
+    for y in range(by - ring + 1, by + ring):
+        keys.append((bx - ring, y))
+        keys.append((bx + ring, y))
+    return keys
+
+
 class TectonicsModel:
     """Voronoi-like plate assignment with boundary classification on a wrapped X world."""
 
@@ -45,56 +62,112 @@ class TectonicsModel:
         self.seed = int(seed)
         self.config = config
         self._seeds = self._build_plate_seeds()
+        self._build_seed_grid()
+        # Plate type and motion depend only on the plate id, so build each PlateData once.
+        self._plates: tuple[PlateData, ...] = tuple(
+            PlateData(
+                plate_id=plate_id,
+                plate_type=self._plate_type(plate_id),
+                motion=self._MOTIONS[self._hash_u64("motion", plate_id) % len(self._MOTIONS)],
+            )
+            for plate_id, _, _ in self._seeds
+        )
         self._cache_maxsize = 200_000 if config.profile == WorldProfile.TARGET else config.width * config.height
-        self._plate_cache: OrderedDict[tuple[int, int], PlateData] = OrderedDict()
-        self._boundary_cache: OrderedDict[tuple[int, int], BoundaryData] = OrderedDict()
+        # Worlds within the cache budget keep dense per-cell plate ids and boundaries
+        # (row-major, WorldConfig.index) filled on first use; capped TARGET worlds
+        # fall back to bounded LRU caches.
+        cell_count = config.width * config.height
+        self._dense = cell_count <= self._cache_maxsize
+        self._plate_ids = bytearray([_PLATE_UNSET]) * cell_count if self._dense else bytearray()
+        self._plate_filled = 0
+        self._boundaries: list[BoundaryData | None] = [None] * cell_count if self._dense else []
+        self._boundary_filled = 0
+        self._plate_cache: dict[int, PlateData] = {}
+        self._boundary_cache: dict[int, BoundaryData] = {}
+        # Motions are always one of the six axial directions, so every boundary
+        # classification is a table lookup by (motion_a, motion_b, direction) index.
+        self._plate_motion_idx = tuple(self._MOTIONS.index(plate.motion) for plate in self._plates)
+        self._boundary_lut = self._build_boundary_lut()
 
     def plate_at(self, q: int, r: int) -> PlateData | None:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
+        key = self.config.encode(q, r)
+        if key is None:
             return None
-        cached = self._cache_get(self._plate_cache, canonical)
-        if cached is not None:
-            return cached
-
-        cq, cr = canonical
-        plate_id, _, _, _, _ = self._nearest_seed(cq, cr)
-        plate = PlateData(
-            plate_id=plate_id,
-            plate_type=self._plate_type(plate_id),
-            motion=self._MOTIONS[self._hash_u64("motion", plate_id) % len(self._MOTIONS)],
-        )
-        self._cache_put(self._plate_cache, canonical, plate)
-        return plate
+        return self._plates[self._plate_id_at(key)]
 
     def boundary_at(self, q: int, r: int) -> BoundaryData:
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
-            return BoundaryData(kind=BoundaryKind.NONE, strength=0.0)
-        cached = self._cache_get(self._boundary_cache, canonical)
+        key = self.config.encode(q, r)
+        if key is None:
+            return _NO_BOUNDARY
+        if self._dense:
+            cached = self._boundaries[key]
+        else:
+            cached = self._cache_get(self._boundary_cache, key)
         if cached is not None:
             return cached
 
-        current = self.plate_at(*canonical)
-        assert current is not None
-        best = BoundaryData(kind=BoundaryKind.NONE, strength=0.0)
+        cq, cr = self.config.decode(key)
+        current_id = self._plate_id_at(key)
+        motion_idx = self._plate_motion_idx
+        current_motion = motion_idx[current_id]
+        boundary_lut = self._boundary_lut
+        best = _NO_BOUNDARY
 
-        for dq, dr in AXIAL_DIRECTIONS:
-            neighbor = self.config.canonicalize(canonical[0] + dq, canonical[1] + dr)
-            if neighbor is None:
+        for direction_idx, (dq, dr) in enumerate(AXIAL_DIRECTIONS):
+            neighbor_key = self.config.encode(cq + dq, cr + dr)
+            if neighbor_key is None:
                 continue
-            other = self.plate_at(*neighbor)
-            assert other is not None
-            if other.plate_id == current.plate_id:
+            other_id = self._plate_id_at(neighbor_key)
+            if other_id == current_id:
                 continue
 
-            kind, strength = self._classify_boundary(current, other, (dq, dr))
-            if strength > best.strength:
-                best = BoundaryData(kind=kind, strength=strength)
+            boundary = boundary_lut[(current_motion * 6 + motion_idx[other_id]) * 6 + direction_idx]
+            if boundary.strength > best.strength:
+                best = boundary
 
-        self._cache_put(self._boundary_cache, canonical, best)
+        if self._dense:
+            self._boundaries[key] = best
+            self._boundary_filled += 1
+        else:
+            self._cache_put(self._boundary_cache, key, best)
         return best
 
+    def cached_plate_count(self) -> int:
+        """Number of cells with a resolved plate assignment."""
+        return self._plate_filled if self._dense else len(self._plate_cache)
+
+    def cached_boundary_count(self) -> int:
+        """Number of cells with a classified boundary."""
+        return self._boundary_filled if self._dense else len(self._boundary_cache)
+
+    def _plate_id_at(self, key: int) -> int:
+        if self._dense:
+            plate_id = self._plate_ids[key]
+            if plate_id == _PLATE_UNSET:
+                plate_id = self._nearest_seed(*self.config.decode(key))[0]
+                self._plate_ids[key] = plate_id
+                self._plate_filled += 1
+            return plate_id
+
+        cached = self._cache_get(self._plate_cache, key)
+        if cached is not None:
+            return cached.plate_id
+        plate = self._plates[self._nearest_seed(*self.config.decode(key))[0]]
+        self._cache_put(self._plate_cache, key, plate)
+        return plate.plate_id
+
+    def _build_boundary_lut(self) -> tuple[BoundaryData, ...]:
+        """Classify every (motion_a, motion_b, direction) index triple once, row-major."""
+        lut: list[BoundaryData] = []
+        for motion_a in self._MOTIONS:
+            current = PlateData(plate_id=-1, plate_type=PlateType.OCEANIC, motion=motion_a)
+            for motion_b in self._MOTIONS:
+                other = PlateData(plate_id=-1, plate_type=PlateType.OCEANIC, motion=motion_b)
+                for direction in AXIAL_DIRECTIONS:
+                    kind, strength = self._classify_boundary(current, other, direction)
+                    lut.append(BoundaryData(kind=kind, strength=strength))
+        return tuple(lut)
+
     def _classify_boundary(
         self,
         current: PlateData,
@@ -127,22 +200,22 @@ class TectonicsModel:
             return BoundaryKind.DIVERGENT, min(1.0, n_abs / 2.5)
         return BoundaryKind.TRANSFORM, min(1.0, max(0.0, t_abs / 2.5))
 
-    def _cache_get(self, cache: OrderedDict[tuple[int, int], PlateData | BoundaryData], key: tuple[int, int]) -> PlateData | BoundaryData | None:
-        value = cache.get(key)
+    def _cache_get(self, cache: dict[int, PlateData | BoundaryData], key: int) -> PlateData | BoundaryData | None:
+        value = cache.pop(key, None)
         if value is not None:
-            cache.move_to_end(key)
+            cache[key] = value
         return value
 
     def _cache_put(
         self,
-        cache: OrderedDict[tuple[int, int], PlateData | BoundaryData],
-        key: tuple[int, int],
+        cache: dict[int, PlateData | BoundaryData],
+        key: int,
         value: PlateData | BoundaryData,
     ) -> None:
+        cache.pop(key, None)
         cache[key] = value
-        cache.move_to_end(key)
         if len(cache) > self._cache_maxsize:
-            cache.popitem(last=False)
+            del cache[next(iter(cache))]
 
     def _build_plate_seeds(self) -> tuple[tuple[int, int, int], ...]:
         plate_count = max(12, min(96, (self.config.width * self.config.height) // 4096))
@@ -153,21 +226,49 @@ class TectonicsModel:
             seeds.append((plate_id, sq, sr))
         return tuple(seeds)
 
-    def _nearest_seed(self, q: int, r: int) -> tuple[int, int, int, int, int]:
-        best: tuple[int, int, int, int, int] | None = None
-
+    def _build_seed_grid(self) -> None:
+        """Bucket every wrapped copy of each plate seed into a coarse spatial hash."""
+        width = self.config.width
+        cell = max(1, isqrt((width * self.config.height) // len(self._seeds)))
+        buckets: dict[tuple[int, int], list[tuple[int, int, int, int]]] = {}
         for plate_id, sq, sr in self._seeds:
-            for wrap in (-self.config.width, 0, self.config.width):
-                dx = q - (sq + wrap)
-                dy = r - sr
-                dist_sq = dx * dx + dy * dy
-                candidate = (dist_sq, plate_id, sq, sr, wrap)
-                if best is None or candidate < best:
-                    best = candidate
-
-        assert best is not None
-        _, plate_id, sq, sr, wrap = best
-        return plate_id, sq, sr, wrap, best[0]
+            for wrap in (-width, 0, width):
+                key = ((sq + wrap) // cell, sr // cell)
+                buckets.setdefault(key, []).append((plate_id, sq, sr, wrap))
+        self._seed_cell = cell
+        self._seed_buckets = {key: tuple(entries) for key, entries in buckets.items()}
+        # Enough rings to cover every wrapped seed from any canonical cell.
+        self._seed_max_ring = (3 * width + self.config.height) // cell + 2
+
+    def _nearest_seed(self, q: int, r: int) -> tuple[int, int, int, int, int]:
+        """Nearest wrapped seed, ties broken by (plate_id, sq, sr, wrap).
+
+        Rings of hash buckets are scanned outward until no unvisited bucket can
+        hold a closer seed: every seed beyond ring k is more than k * cell away.
+        """
+        cell = self._seed_cell
+        buckets = self._seed_buckets
+        bx = q // cell
+        by = r // cell
+        # Sentinel farther than any seed, so candidates never need a None check.
+        best: tuple[float, int, int, int, int] = (float("inf"), -1, 0, 0, 0)
+
+        ring = 0
+        while True:
+            for key in _ring_keys(bx, by, ring):
+                for plate_id, sq, sr, wrap in buckets.get(key, ()):
+                    dx = q - (sq + wrap)
+                    dy = r - sr
+                    candidate = (dx * dx + dy * dy, plate_id, sq, sr, wrap)
+                    if candidate < best:
+                        best = candidate
+            reach = ring * cell
+            if best[0] <= reach * reach or ring >= self._seed_max_ring:
+                break
+            ring += 1
+
+        dist_sq, plate_id, sq, sr, wrap = best
+        return plate_id, sq, sr, wrap, int(dist_sq)
 
     def _plate_type(self, plate_id: int) -> PlateType:
         sample = self._hash_u64("plate_type", plate_id) / float((1 << 64) - 1)
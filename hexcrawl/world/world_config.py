@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 
 
 class WorldProfile(str, Enum):
@@ -27,19 +28,21 @@ class WorldConfig:
     wrap_x: bool = True
     wrap_y: bool = False
 
-    @property
+    # Bounds are derived from frozen fields, so each is computed once per config;
+    # canonicalize runs for nearly every world/climate lookup.
+    @cached_property
     def q_min(self) -> int:
         return -(self.width // 2)
 
-    @property
+    @cached_property
     def q_max(self) -> int:
         return self.q_min + self.width - 1
 
-    @property
+    @cached_property
     def r_min(self) -> int:
         return -(self.height // 2)
 
-    @property
+    @cached_property
     def r_max(self) -> int:
         return self.r_min + self.height - 1
 
@@ -48,15 +51,45 @@ class WorldConfig:
 
     def canonicalize(self, q: int, r: int) -> tuple[int, int] | None:
         """Return canonical world coordinates or None for out-of-world rows."""
-        if not self.is_r_in_bounds(r):
+        if not self.r_min <= r <= self.r_max:
             return None
 
+        # In-bounds columns are already canonical, with or without x-wrap.
+        if self.q_min <= q <= self.q_max:
+            return q, r
         if self.wrap_x:
-            q = ((q - self.q_min) % self.width) + self.q_min
-        elif q < self.q_min or q > self.q_max:
+            # Neighbor and stencil offsets land within one world width of the grid,
+            # so a single shift resolves them; the modulo is the general fallback.
+            q_min = self.q_min
+            width = self.width
+            shifted = q + width if q < q_min else q - width
+            if q_min <= shifted < q_min + width:
+                return shifted, r
+            return ((q - q_min) % width) + q_min, r
+        return None
+
+    def index(self, q: int, r: int) -> int:
+        """Return the row-major cell index of already-canonical coordinates."""
+        return (r - self.r_min) * self.width + (q - self.q_min)
+
+    def encode(self, q: int, r: int) -> int | None:
+        """Return the row-major cell index of (q, r) or None for out-of-world rows.
+
+        Int keys hash faster than (q, r) tuples and avoid allocating one per lookup.
+        """
+        if not self.r_min <= r <= self.r_max:
             return None
+        q_offset = q - self.q_min
+        if 0 <= q_offset < self.width:
+            return (r - self.r_min) * self.width + q_offset
+        if self.wrap_x:
+            return (r - self.r_min) * self.width + q_offset % self.width
+        return None
 
-        return q, r
+    def decode(self, index: int) -> tuple[int, int]:
+        """Inverse of encode: canonical (q, r) for a row-major cell index."""
+        row, col = divmod(index, self.width)
+        return col + self.q_min, row + self.r_min
 
 
 def build_world_config(profile: WorldProfile) -> WorldConfig:
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
-import hashlib
+from itertools import accumulate
 import math
-from collections import OrderedDict
 
-from hexcrawl.core.hex_math import AXIAL_DIRECTIONS
+from hexcrawl.core.hex_math import AXIAL_DIRECTIONS, axial_neighbor_strides
 from hexcrawl.world.erosion import ErosionModel
-from hexcrawl.world.hydrology import HydrologyModel
+from hexcrawl.world.hydrology import HydrologyModel, RiverBlock
 from hexcrawl.world.tectonics import BoundaryData, BoundaryKind, PlateData, PlateType, TectonicsModel
 from hexcrawl.world.world_config import WorldConfig, default_world_config
 
@@ -26,6 +27,34 @@ class TerrainType(str, Enum):
     SNOW = "SNOW"
 
 
+# Stable small-int ids for terrain types, used by dense per-tile terrain storage.
+TERRAIN_TYPES: tuple[TerrainType, ...] = tuple(TerrainType)
+_TERRAIN_IDS: dict[TerrainType, int] = {terrain: idx for idx, terrain in enumerate(TERRAIN_TYPES)}
+_TERRAIN_UNSET = 0xFF
+# Land terrain ids in threshold order; bisect_right over the land thresholds indexes them.
+_LAND_TERRAIN_IDS: tuple[int, ...] = tuple(
+    _TERRAIN_IDS[terrain]
+    for terrain in (TerrainType.PLAINS, TerrainType.HILLS, TerrainType.MOUNTAINS, TerrainType.SNOW)
+)
+# Heights are clamped to [0, 1], so any negative value marks an unfilled slot.
+_HEIGHT_UNSET = -1.0
+# Boundary biases can take either sign, so unfilled slots hold infinity.
+_BIAS_UNSET = math.inf
+
+_MASK64 = (1 << 64) - 1
+# float(_MASK64) rounds to 2**64, so scaling by the reciprocal is exact.
+_INV_MASK64 = 1.0 / float(_MASK64)
+
+# Smoothing weight totals by in-world neighbor count, summed in the same order as
+# the 7-tap loop so the divisor matches it bit for bit.
+_SMOOTHING_WEIGHT_TOTALS: tuple[float, ...] = tuple(
+    accumulate([0.40 / len(AXIAL_DIRECTIONS)] * len(AXIAL_DIRECTIONS), initial=0.60)
+)
+
+_FBM_FREQUENCIES = (2, 4, 8, 16)
+_FBM_AMPLITUDES = (0.60, 0.25, 0.10, 0.05)
+
+
 @dataclass(frozen=True)
 class WorldTile:
     """Generated world tile data for a single axial coordinate."""
@@ -46,20 +75,53 @@ class WorldGen:
     def __init__(self, seed: int, config: WorldConfig | None = None) -> None:
         self.seed = int(seed)
         self.config = default_world_config() if config is None else config
+        self._noise_seed = (self.seed * 0x9E3779B97F4A7C15) & _MASK64
+        # FBM octaves sample only freq x (freq + 1) lattice corners over the unit world,
+        # so each octave's corners are hashed once into [iy][ix] rows.
+        self._lattice_rows: dict[int, tuple[tuple[float, ...], ...]] = {
+            freq: self._build_lattice_rows(freq) for freq in _FBM_FREQUENCIES
+        }
+        # Normalized positions depend only on the column or row; tabulating the exact
+        # quotients replaces two divisions per raw height with two index reads.
+        self._norm_xs = tuple(col / self.config.width for col in range(self.config.width))
+        self._norm_ys = tuple(row / self.config.height for row in range(self.config.height))
+        # The latitude falloff subtracted from _fbm_noise depends only on the row.
+        self._radial_terms = tuple(0.08 * abs(math.sin((y - 0.5) * math.pi)) for y in self._norm_ys)
+        self._fbm_octaves = tuple(
+            (freq, amplitude, self._lattice_rows[freq]) for freq, amplitude in zip(_FBM_FREQUENCIES, _FBM_AMPLITUDES)
+        )
         self._height_cache_maxsize = self._resolve_cache_maxsize()
         self._tile_cache_maxsize = self._resolve_cache_maxsize()
         self._raw_height_cache_maxsize = self._resolve_cache_maxsize()
         self._boundary_influence_cache_maxsize = self._resolve_cache_maxsize()
-        self._raw_height_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
-        self._boundary_influence_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
-        self._height_cache: OrderedDict[tuple[int, int], float] = OrderedDict()
-        self._tile_cache: OrderedDict[tuple[int, int], WorldTile] = OrderedDict()
+        # Caches are keyed by row-major cell index (WorldConfig.index) rather than (q, r).
+        self._raw_height_cache: dict[int, float] = {}
+        self._boundary_influence_cache: dict[int, float] = {}
+        self._boundary_bias_cache: dict[int, float] = {}
+        self._height_cache: dict[int, float] = {}
+        self._tile_cache: dict[int, WorldTile] = {}
+        # Worlds within the cache budget (DEV) keep raw, pre-erosion and final heights
+        # in dense row-major grids, _HEIGHT_UNSET until computed; the dicts above stay
+        # empty. Capped TARGET worlds use the bounded dicts and recompute base heights.
+        cell_count = self.config.width * self.config.height
+        dense = cell_count <= self._height_cache_maxsize
+        self._raw_heights: array | None = array("d", [_HEIGHT_UNSET]) * cell_count if dense else None
+        self._base_heights: array | None = array("d", [_HEIGHT_UNSET]) * cell_count if dense else None
+        self._heights: array | None = array("d", [_HEIGHT_UNSET]) * cell_count if dense else None
+        self._raw_height_filled = 0
+        self._height_filled = 0
+        # Every tile's falloff window shares per-cell boundary biases, so each is computed once.
+        self._boundary_biases: array | None = array("d", [_BIAS_UNSET]) * cell_count if dense else None
+        self._falloff_kernel = self._build_falloff_kernel(self.BOUNDARY_FALLOFF_RADIUS)
+        self._row_strides = axial_neighbor_strides(self.config.width, self.config.height, self.config.wrap_x)
+        # Dense terrain ids (one byte per canonical tile) for bulk lookups in render loops.
+        self._terrain_ids = bytearray([_TERRAIN_UNSET]) * (self.config.width * self.config.height)
         self._tectonics = TectonicsModel(seed=self.seed, config=self.config)
         self._hydrology = HydrologyModel(
             seed=self.seed + 3,
             config=self.config,
             height_fn=self._base_height_at,
-            is_ocean_fn=lambda q, r: self._is_ocean_height(self._base_height_at(q, r)),
+            ocean_threshold=self.OCEAN_THRESHOLD,
         )
         self._erosion = ErosionModel(
             config=self.config,
@@ -70,56 +132,170 @@ class WorldGen:
 
     def get_tile(self, q: int, r: int) -> WorldTile:
         """Return deterministic tile data for axial hex coordinates."""
-        canonical = self.config.canonicalize(q, r)
-        if canonical is None:
-            return WorldTile(height=0.0, terrain_type=TerrainType.OCEAN)
+        config = self.config
+        if config.q_min <= q <= config.q_max and config.r_min <= r <= config.r_max:
+            # In-bounds coordinates are already canonical.
+            canonical = (q, r)
+        else:
+            canonical = config.canonicalize(q, r)
+            if canonical is None:
+                return WorldTile(height=0.0, terrain_type=TerrainType.OCEAN)
 
         cq, cr = canonical
-        cached_tile = self._cache_get(self._tile_cache, canonical)
+        key = config.index(cq, cr)
+        cached_tile = self._cache_get(self._tile_cache, key)
         if cached_tile is not None:
             return cached_tile
 
         height = self._height_at(cq, cr)
 
-        if self._is_ocean_height(height):
+        if height < self.OCEAN_THRESHOLD:
             terrain = TerrainType.OCEAN
         elif self._has_ocean_neighbor(cq, cr):
             terrain = TerrainType.COAST
-        elif height < self.PLAINS_THRESHOLD:
-            terrain = TerrainType.PLAINS
-        elif height < self.HILLS_THRESHOLD:
-            terrain = TerrainType.HILLS
-        elif height < self.MOUNTAINS_THRESHOLD:
-            terrain = TerrainType.MOUNTAINS
         else:
-            terrain = TerrainType.SNOW
+            terrain = self._land_terrain(height)
 
         tile = WorldTile(height=height, terrain_type=terrain)
-        self._cache_set(self._tile_cache, canonical, tile, self._tile_cache_maxsize)
+        self._cache_set(self._tile_cache, key, tile, self._tile_cache_maxsize)
+        self._terrain_ids[key] = _TERRAIN_IDS[terrain]
         return tile
 
+    def build_arrays(self) -> tuple[array, bytearray]:
+        """Compute heights and terrain ids for the whole world in one pass.
+
+        Returns row-major (r, then q) dense heights and TERRAIN_TYPES ids, and
+        fills the per-tile terrain ids used by get_terrain_id. Coast detection
+        dilates the ocean mask over neighbor indices instead of re-fetching six
+        neighbor heights per tile. Only worlds that fit the cache budget (DEV)
+        are supported.
+        """
+        config = self.config
+        width = config.width
+        if width * config.height > self._height_cache_maxsize:
+            raise ValueError("build_arrays requires a world that fits the height cache")
+
+        height_at = self._height_at
+        heights = array(
+            "d",
+            (
+                height_at(q, r)
+                for r in range(config.r_min, config.r_max + 1)
+                for q in range(config.q_min, config.q_max + 1)
+            ),
+        )
+        ocean_threshold = self.OCEAN_THRESHOLD
+        ocean = bytearray(height < ocean_threshold for height in heights)
+
+        # Land tiles become COAST when any neighbor is ocean or falls outside the world.
+        ocean_id = _TERRAIN_IDS[TerrainType.OCEAN]
+        coast_id = _TERRAIN_IDS[TerrainType.COAST]
+        terrain_ids = self._terrain_ids
+        # Same strict `<` ladder as _land_terrain, as one bisect per land tile.
+        land_thresholds = (self.PLAINS_THRESHOLD, self.HILLS_THRESHOLD, self.MOUNTAINS_THRESHOLD)
+        row_strides = self._row_strides
+        last_col = width - 1
+        idx = 0
+        for row in range(config.height):
+            first, interior, last = row_strides[row]
+            for col in range(width):
+                if ocean[idx]:
+                    terrain_ids[idx] = ocean_id
+                    idx += 1
+                    continue
+
+                strides = interior if 0 < col < last_col else (first if col == 0 else last)
+                # Fewer than six in-world neighbors means the tile touches the world edge.
+                coast = len(strides) < len(AXIAL_DIRECTIONS)
+                if not coast:
+                    for stride in strides:
+                        if ocean[idx + stride]:
+                            coast = True
+                            break
+
+                terrain_ids[idx] = coast_id if coast else _LAND_TERRAIN_IDS[bisect_right(land_thresholds, heights[idx])]
+                idx += 1
+
+        return heights, bytearray(terrain_ids)
+
+    def get_terrain_id(self, q: int, r: int) -> int:
+        """Return the TERRAIN_TYPES index for axial hex coordinates."""
+        config = self.config
+        if config.q_min <= q <= config.q_max and config.r_min <= r <= config.r_max:
+            cq, cr = q, r
+        else:
+            canonical = config.canonicalize(q, r)
+            if canonical is None:
+                return _TERRAIN_IDS[TerrainType.OCEAN]
+            cq, cr = canonical
+        key = config.index(cq, cr)
+        terrain_id = self._terrain_ids[key]
+        if terrain_id == _TERRAIN_UNSET:
+            if self._heights is not None:
+                # Dense worlds resolve erosion for the whole grid on the first height
+                # anyway, so classify every tile at once with the ocean-mask dilation.
+                self.build_arrays()
+                terrain_id = self._terrain_ids[key]
+            else:
+                terrain_id = _TERRAIN_IDS[self.get_tile(cq, cr).terrain_type]
+        return terrain_id
+
+    def cached_height_count(self) -> int:
+        """Number of cells with a resolved final height."""
+        return self._height_filled if self._heights is not None else len(self._height_cache)
+
+    def cached_raw_height_count(self) -> int:
+        """Number of cells with a resolved raw (pre-smoothing) height."""
+        return self._raw_height_filled if self._raw_heights is not None else len(self._raw_height_cache)
+
     def _height_at(self, q: int, r: int) -> float:
-        cached_height = self._cache_get(self._height_cache, (q, r))
-        if cached_height is not None:
-            return cached_height
+        key = self.config.index(q, r)
+        heights = self._heights
+        if heights is not None:
+            cached_height = heights[key]
+            if cached_height >= 0.0:
+                return cached_height
+        else:
+            cached_height = self._cache_get(self._height_cache, key)
+            if cached_height is not None:
+                return cached_height
 
         eroded_height = self._erosion.eroded_height(q, r)
 
         clamped = max(0.0, min(1.0, eroded_height))
-        self._cache_set(self._height_cache, (q, r), clamped, self._height_cache_maxsize)
+        if heights is not None:
+            heights[key] = clamped
+            self._height_filled += 1
+        else:
+            self._cache_set(self._height_cache, key, clamped, self._height_cache_maxsize)
         return clamped
 
     def _base_height_at(self, q: int, r: int) -> float:
-        smoothed_height = self._smoothed_height_at(q, r)
-        return max(0.0, min(1.0, smoothed_height))
+        base_heights = self._base_heights
+        if base_heights is None:
+            return max(0.0, min(1.0, self._smoothed_height_at(q, r)))
+
+        idx = self.config.index(q, r)
+        value = base_heights[idx]
+        if value < 0.0:
+            value = max(0.0, min(1.0, self._smoothed_height_at(q, r)))
+            base_heights[idx] = value
+        return value
 
     def _raw_height_at(self, q: int, r: int) -> float:
-        cached_height = self._cache_get(self._raw_height_cache, (q, r))
-        if cached_height is not None:
-            return cached_height
+        key = self.config.index(q, r)
+        raw_heights = self._raw_heights
+        if raw_heights is not None:
+            cached_height = raw_heights[key]
+            if cached_height >= 0.0:
+                return cached_height
+        else:
+            cached_height = self._cache_get(self._raw_height_cache, key)
+            if cached_height is not None:
+                return cached_height
 
         x, y = self._normalized_world_pos(q, r)
-        base_height = self._fbm_height(x, y)
+        base_height = self._fbm_noise(x, y) - self._radial_terms[r - self.config.r_min]
 
         plate = self._tectonics.plate_at(q, r)
 
@@ -134,63 +310,101 @@ class WorldGen:
 
         height = base_height + plate_bias + boundary_bias
         clamped = max(0.0, min(1.0, height))
-        self._cache_set(self._raw_height_cache, (q, r), clamped, self._raw_height_cache_maxsize)
+        if raw_heights is not None:
+            raw_heights[key] = clamped
+            self._raw_height_filled += 1
+        else:
+            self._cache_set(self._raw_height_cache, key, clamped, self._raw_height_cache_maxsize)
         return clamped
 
     def _smoothed_height_at(self, q: int, r: int) -> float:
         center = self._raw_height_at(q, r)
         total = center * 0.60
-        total_weight = 0.60
-
-        for dq, dr in AXIAL_DIRECTIONS:
-            neighbor = self.config.canonicalize(q + dq, r + dr)
-            if neighbor is None:
-                continue
-            total += self._raw_height_at(*neighbor) * 0.40 / len(AXIAL_DIRECTIONS)
-            total_weight += 0.40 / len(AXIAL_DIRECTIONS)
+        neighbor_count = len(AXIAL_DIRECTIONS)
+        config = self.config
+        raw_heights = self._raw_heights
+
+        if raw_heights is not None:
+            # Dense worlds walk the precomputed neighbor strides (AXIAL_DIRECTIONS
+            # order, off-world taps dropped) and read the raw-height grid directly;
+            # adjacent tiles share most taps, so only misses are computed.
+            strides = self._neighbor_strides(q, r)
+            idx = config.index(q, r)
+            for stride in strides:
+                raw = raw_heights[idx + stride]
+                if raw < 0.0:
+                    raw = self._raw_height_at(*config.decode(idx + stride))
+                total += raw * 0.40 / neighbor_count
+            in_world = len(strides)
+        else:
+            in_world = 0
+            for dq, dr in AXIAL_DIRECTIONS:
+                neighbor = config.canonicalize(q + dq, r + dr)
+                if neighbor is None:
+                    continue
+                total += self._raw_height_at(*neighbor) * 0.40 / neighbor_count
+                in_world += 1
 
-        if total_weight == 0.0:
-            return center
-        return total / total_weight
+        return total / _SMOOTHING_WEIGHT_TOTALS[in_world]
 
     def _boundary_falloff_influence_at(self, q: int, r: int) -> float:
-        cached = self._cache_get(self._boundary_influence_cache, (q, r))
+        key = self.config.index(q, r)
+        cached = self._cache_get(self._boundary_influence_cache, key)
         if cached is not None:
             return cached
 
-        radius = self.BOUNDARY_FALLOFF_RADIUS
+        encode = self.config.encode
+        bias_for = self._boundary_bias_for
         weighted_sum = 0.0
         total_weight = 0.0
 
-        for dq in range(-radius, radius + 1):
-            for dr in range(-radius, radius + 1):
-                ds = -dq - dr
-                distance = max(abs(dq), abs(dr), abs(ds))
-                if distance > radius:
-                    continue
-
-                sample = self.config.canonicalize(q + dq, r + dr)
-                if sample is None:
-                    continue
-
-                weight = (radius + 1 - distance) / (radius + 1)
-                if weight <= 0.0:
-                    continue
-
-                sample_plate = self._tectonics.plate_at(*sample)
-                sample_boundary = self._tectonics.boundary_at(*sample)
-                weighted_sum += self._boundary_bias_at(sample[0], sample[1], sample_plate, sample_boundary) * weight
-                total_weight += weight
+        for dq, dr, weight in self._falloff_kernel:
+            sample = encode(q + dq, r + dr)
+            if sample is None:
+                continue
+            weighted_sum += bias_for(sample) * weight
+            total_weight += weight
 
         influence = 0.0 if total_weight == 0.0 else weighted_sum / total_weight
         self._cache_set(
             self._boundary_influence_cache,
-            (q, r),
+            key,
             influence,
             self._boundary_influence_cache_maxsize,
         )
         return influence
 
+    @staticmethod
+    def _build_falloff_kernel(radius: int) -> tuple[tuple[int, int, float], ...]:
+        """Hex-disk (dq, dr, weight) taps with triangular falloff, in dq-then-dr scan order."""
+        kernel: list[tuple[int, int, float]] = []
+        for dq in range(-radius, radius + 1):
+            for dr in range(-radius, radius + 1):
+                distance = max(abs(dq), abs(dr), abs(dq + dr))
+                if distance <= radius:
+                    kernel.append((dq, dr, (radius + 1 - distance) / (radius + 1)))
+        return tuple(kernel)
+
+    def _boundary_bias_for(self, key: int) -> float:
+        """Boundary bias of the cell at row-major index `key`, computed once per cell."""
+        biases = self._boundary_biases
+        if biases is not None:
+            bias = biases[key]
+            if bias != _BIAS_UNSET:
+                return bias
+        else:
+            cached = self._cache_get(self._boundary_bias_cache, key)
+            if cached is not None:
+                return cached
+
+        q, r = self.config.decode(key)
+        bias = self._boundary_bias_at(q, r, self._tectonics.plate_at(q, r), self._tectonics.boundary_at(q, r))
+        if biases is not None:
+            biases[key] = bias
+        else:
+            self._cache_set(self._boundary_bias_cache, key, bias, self._boundary_influence_cache_maxsize)
+        return bias
+
     def _boundary_bias_at(
         self,
         q: int,
@@ -227,47 +441,68 @@ class WorldGen:
         return 200_000
 
     @staticmethod
-    def _cache_get(cache: OrderedDict[tuple[int, int], object], key: tuple[int, int]) -> object | None:
-        value = cache.get(key)
+    def _cache_get(cache: dict[int, object], key: int) -> object | None:
+        value = cache.pop(key, None)
         if value is None:
             return None
-        cache.move_to_end(key)
+        cache[key] = value
         return value
 
     @staticmethod
     def _cache_set(
-        cache: OrderedDict[tuple[int, int], object],
-        key: tuple[int, int],
+        cache: dict[int, object],
+        key: int,
         value: object,
         maxsize: int,
     ) -> None:
+        cache.pop(key, None)
         cache[key] = value
-        cache.move_to_end(key)
         while len(cache) > maxsize:
-            cache.popitem(last=False)
+            del cache[next(iter(cache))]
 
     def _normalized_world_pos(self, q: int, r: int) -> tuple[float, float]:
         """Map canonical axial coordinates into normalized [0,1) world space."""
-        x = (q - self.config.q_min) / self.config.width
-        y = (r - self.config.r_min) / self.config.height
-        return x, y
-
-    def _fbm_height(self, x: float, y: float) -> float:
-        """Fractal value noise for large connected continents and ocean basins."""
-        frequencies = (2, 4, 8, 16)
-        amplitudes = (0.60, 0.25, 0.10, 0.05)
-        total = 0.0
+        return self._norm_xs[q - self.config.q_min], self._norm_ys[r - self.config.r_min]
 
-        for freq, amplitude in zip(frequencies, amplitudes):
-            total += amplitude * self._value_noise(x, y, freq)
+    def _fbm_noise(self, x: float, y: float) -> float:
+        """Fractal value noise for large connected continents and ocean basins.
 
-        continent_mask = self._value_noise(x, y, 2)
-        total = (total * 0.70) + (continent_mask * 0.30)
+        Excludes the latitude falloff; callers subtract `_radial_terms[row]`.
 
-        radial = math.sin((y - 0.5) * math.pi)
-        total -= 0.08 * abs(radial)
+        The octave loop inlines _value_noise over the precomputed lattice rows;
+        the arithmetic matches it term for term.
+        """
+        floor = math.floor
+        total = 0.0
+        continent_mask = 0.0
+
+        for freq, amplitude, rows in self._fbm_octaves:
+            sx = x * freq
+            sy = y * freq
+            ix0 = floor(sx)
+            iy0 = floor(sy)
+            if 0 <= iy0 < freq:
+                fx = sx - ix0
+                fy = sy - iy0
+                row0 = rows[iy0]
+                row1 = rows[iy0 + 1]
+                wx0 = ix0 % freq
+                wx1 = (ix0 + 1) % freq
+                ux = fx * fx * (3.0 - 2.0 * fx)
+                uy = fy * fy * (3.0 - 2.0 * fy)
+                n00 = row0[wx0]
+                n01 = row1[wx0]
+                nx0 = n00 + (row0[wx1] - n00) * ux
+                nx1 = n01 + (row1[wx1] - n01) * ux
+                noise = nx0 + (nx1 - nx0) * uy
+            else:
+                noise = self._value_noise(x, y, freq)
+            total += amplitude * noise
+            if freq == 2:
+                # The continent mask is the same frequency-2 sample.
+                continent_mask = noise
 
-        return total
+        return (total * 0.70) + (continent_mask * 0.30)
 
     def _value_noise(self, x: float, y: float, freq: int) -> float:
         """Continuous value noise with explicit x-periodicity for wrap seams."""
@@ -282,50 +517,92 @@ class WorldGen:
         ix1 = ix0 + 1
         iy1 = iy0 + 1
 
-        x_period = freq
+        rows = self._lattice_rows.get(freq)
+        if rows is not None and 0 <= iy0 and iy1 < len(rows):
+            row0 = rows[iy0]
+            row1 = rows[iy1]
+            wx0 = ix0 % freq
+            wx1 = ix1 % freq
+            n00 = row0[wx0]
+            n10 = row0[wx1]
+            n01 = row1[wx0]
+            n11 = row1[wx1]
+        else:
+            x_period = freq
+            y_period = freq if self.config.wrap_y else None
+            n00 = self._lattice_noise(ix0, iy0, x_period, y_period)
+            n10 = self._lattice_noise(ix1, iy0, x_period, y_period)
+            n01 = self._lattice_noise(ix0, iy1, x_period, y_period)
+            n11 = self._lattice_noise(ix1, iy1, x_period, y_period)
+
+        # Smoothstep weights and bilinear lerps, inlined.
+        ux = fx * fx * (3.0 - 2.0 * fx)
+        uy = fy * fy * (3.0 - 2.0 * fy)
+        nx0 = n00 + (n10 - n00) * ux
+        nx1 = n01 + (n11 - n01) * ux
+        return nx0 + (nx1 - nx0) * uy
+
+    def _build_lattice_rows(self, freq: int) -> tuple[tuple[float, ...], ...]:
         y_period = freq if self.config.wrap_y else None
-
-        n00 = self._lattice_noise(ix0, iy0, x_period, y_period)
-        n10 = self._lattice_noise(ix1, iy0, x_period, y_period)
-        n01 = self._lattice_noise(ix0, iy1, x_period, y_period)
-        n11 = self._lattice_noise(ix1, iy1, x_period, y_period)
-
-        ux = self._smoothstep(fx)
-        uy = self._smoothstep(fy)
-
-        nx0 = self._lerp(n00, n10, ux)
-        nx1 = self._lerp(n01, n11, ux)
-        return self._lerp(nx0, nx1, uy)
+        return tuple(
+            tuple(self._lattice_noise(ix, iy, freq, y_period) for ix in range(freq)) for iy in range(freq + 1)
+        )
 
     def _lattice_noise(self, ix: int, iy: int, x_period: int, y_period: int | None) -> float:
         wrapped_x = ix % x_period
         wrapped_y = iy if y_period is None else iy % y_period
-        raw = self._noise_u64(wrapped_x, wrapped_y)
-        return raw / float((1 << 64) - 1)
-
-    @staticmethod
-    def _lerp(a: float, b: float, t: float) -> float:
-        return a + (b - a) * t
-
-    @staticmethod
-    def _smoothstep(t: float) -> float:
-        return t * t * (3.0 - 2.0 * t)
+        return self._noise_u64(wrapped_x, wrapped_y) * _INV_MASK64
 
     def _noise_u64(self, q: int, r: int) -> int:
-        msg = f"{self.seed}:{q}:{r}".encode("utf-8")
-        digest = hashlib.blake2b(msg, digest_size=8).digest()
-        return int.from_bytes(digest, byteorder="big", signed=False)
-
-    def _is_ocean_height(self, height: float) -> bool:
-        return height < self.OCEAN_THRESHOLD
+        """SplitMix64-style integer hash of (seed, q, r); noise needs no crypto digest."""
+        h = (self._noise_seed ^ (q * 0xBF58476D1CE4E5B9) ^ (r * 0x94D049BB133111EB)) & _MASK64
+        h ^= h >> 30
+        h = (h * 0xBF58476D1CE4E5B9) & _MASK64
+        h ^= h >> 27
+        h = (h * 0x94D049BB133111EB) & _MASK64
+        return h ^ (h >> 31)
+
+    def _land_terrain(self, height: float) -> TerrainType:
+        """Classify a non-ocean, non-coast height."""
+        if height < self.PLAINS_THRESHOLD:
+            return TerrainType.PLAINS
+        if height < self.HILLS_THRESHOLD:
+            return TerrainType.HILLS
+        if height < self.MOUNTAINS_THRESHOLD:
+            return TerrainType.MOUNTAINS
+        return TerrainType.SNOW
+
+    def _neighbor_strides(self, q: int, r: int) -> tuple[int, ...]:
+        """In-world neighbor index offsets of canonical (q, r), in AXIAL_DIRECTIONS order."""
+        config = self.config
+        col = q - config.q_min
+        first, interior, last = self._row_strides[r - config.r_min]
+        if 0 < col < config.width - 1:
+            return interior
+        return first if col == 0 else last
 
     def _has_ocean_neighbor(self, q: int, r: int) -> bool:
+        heights = self._heights
+        if heights is not None:
+            strides = self._neighbor_strides(q, r)
+            # A dropped stride means an off-world neighbor, which counts as ocean.
+            if len(strides) < len(AXIAL_DIRECTIONS):
+                return True
+            config = self.config
+            idx = config.index(q, r)
+            for stride in strides:
+                height = heights[idx + stride]
+                if height < 0.0:
+                    height = self._height_at(*config.decode(idx + stride))
+                if height < self.OCEAN_THRESHOLD:
+                    return True
+            return False
+
         for dq, dr in AXIAL_DIRECTIONS:
             neighbor = self.config.canonicalize(q + dq, r + dr)
             if neighbor is None:
                 return True
-            neighbor_height = self._height_at(*neighbor)
-            if self._is_ocean_height(neighbor_height):
+            if self._height_at(*neighbor) < self.OCEAN_THRESHOLD:
                 return True
         return False
 
@@ -335,6 +612,13 @@ class WorldGen:
     def get_flow_to(self, q: int, r: int) -> tuple[int, int] | None:
         return self._hydrology.flow_to(q, r)
 
+    def get_river_block(self, q0: int, r0: int, q1: int, r1: int) -> RiverBlock:
+        """Return river strength, flow target and lake flags for an inclusive axial block.
+
+        Fields are row-major lists: the entry for (q, r) sits at (r - r0) * (q1 - q0 + 1) + (q - q0).
+        """
+        return self._hydrology.river_block(q0, r0, q1, r1)
+
     def get_valley_strength(self, q: int, r: int) -> float:
         return self._erosion.valley_strength(q, r)
 
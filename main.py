@@ -72,35 +72,59 @@ def run() -> None:
     world_map.set_debug_verbosity(debug_verbosity)
     local_map.set_debug_verbosity(debug_verbosity)
 
+    world_map.on_activate()
     running = True
+
+    def quit_game() -> None:
+        nonlocal running
+        running = False
+
+    def toggle_mode() -> None:
+        nonlocal mode
+        mode = "LOCAL" if mode == "WORLD" else "WORLD"
+        if mode == "WORLD":
+            world_map.on_activate()
+
+    def toggle_fullscreen() -> None:
+        nonlocal is_fullscreen, screen
+        is_fullscreen = not is_fullscreen
+        try:
+            screen = _set_display_mode(is_fullscreen)
+        except pygame.error:
+            is_fullscreen = False
+            screen = _set_display_mode(is_fullscreen)
+
+    def cycle_debug_verbosity() -> None:
+        nonlocal debug_verbosity
+        level_index = DEBUG_VERBOSITY_CYCLE.index(debug_verbosity)
+        debug_verbosity = DEBUG_VERBOSITY_CYCLE[(level_index + 1) % len(DEBUG_VERBOSITY_CYCLE)]
+        world_map.set_debug_verbosity(debug_verbosity)
+        local_map.set_debug_verbosity(debug_verbosity)
+
+    # Global key bindings; every other event goes to the active view.
+    key_handlers = {
+        pygame.K_ESCAPE: quit_game,
+        pygame.K_TAB: toggle_mode,
+        pygame.K_F11: toggle_fullscreen,
+        pygame.K_F2: cycle_debug_verbosity,
+        pygame.K_t: time_model.world_step,
+    }
+
     while running:
         dt = clock.tick(TARGET_FPS) / 1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
-                mode = "LOCAL" if mode == "WORLD" else "WORLD"
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
-                is_fullscreen = not is_fullscreen
-                try:
-                    screen = _set_display_mode(is_fullscreen)
-                except pygame.error:
-                    is_fullscreen = False
-                    screen = _set_display_mode(is_fullscreen)
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
-                level_index = DEBUG_VERBOSITY_CYCLE.index(debug_verbosity)
-                debug_verbosity = DEBUG_VERBOSITY_CYCLE[(level_index + 1) % len(DEBUG_VERBOSITY_CYCLE)]
-                world_map.set_debug_verbosity(debug_verbosity)
-                local_map.set_debug_verbosity(debug_verbosity)
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_t:
-                time_model.world_step()
+                quit_game()
+                continue
+            if event.type == pygame.KEYDOWN:
+                handler = key_handlers.get(event.key)
+                if handler is not None:
+                    handler()
+                    continue
+            if mode == "WORLD":
+                world_map.handle_event(event)
             else:
-                if mode == "WORLD":
-                    world_map.handle_event(event)
-                else:
-                    local_map.handle_event(event)
+                local_map.handle_event(event)
 
         time_model.update(dt)
 
@@ -0,0 +1,29 @@
+"""Shared helpers for the unittest suite."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TypeVar
+
+from hexcrawl.world.world_config import WorldConfig, WorldProfile, build_world_config
+
+ModelT = TypeVar("ModelT")
+
+
+@lru_cache(maxsize=None)
+def cached_world_config(profile: WorldProfile) -> WorldConfig:
+    """Build each profile's config once per process.
+
+    WorldConfig is frozen, so tests can share one instance (and its cached bounds).
+    """
+    return build_world_config(profile)
+
+
+@lru_cache(maxsize=None)
+def shared_model(model_cls: type[ModelT], seed: int, profile: WorldProfile = WorldProfile.DEV) -> ModelT:
+    """Build one seeded model (WorldGen, ClimateGen, TectonicsModel) per process.
+
+    Only for tests that read results; tests that inspect cache sizes, patch
+    internals or compare fresh instances build their own.
+    """
+    return model_cls(seed=seed, config=cached_world_config(profile))
@@ -3,30 +3,51 @@
 from __future__ import annotations
 
 import unittest
+from statistics import fmean
+from unittest.mock import Mock, patch
 
-from hexcrawl.world.climate import BiomeType, ClimateGen
+from hexcrawl.world.climate import BIOME_TYPES, BiomeType, ClimateGen
 from hexcrawl.world.world_config import WorldProfile, build_world_config
 from hexcrawl.world.worldgen import TerrainType
+from tests._helpers import cached_world_config, shared_model
+
+
+def _sample_grid(q_values: range, r_values: range) -> tuple[list[int], list[int]]:
+    """Flatten a q x r sampling window into parallel coordinate lists for get_tiles_bulk."""
+    qs = [q for q in q_values for _ in r_values]
+    rs = [r for _ in q_values for r in r_values]
+    return qs, rs
 
 
 class TestClimateGen(unittest.TestCase):
     def test_deterministic_outputs(self) -> None:
-        climate_gen = ClimateGen(seed=9001, config=build_world_config(WorldProfile.DEV))
+        climate_gen = shared_model(ClimateGen, 9001)
 
         coords = [(-12, 4), (0, 0), (19, -8), (7, 13)]
-        first_pass = [
-            climate_gen.get_tile(q, r, TerrainType.PLAINS, 0.5)
-            for q, r in coords
-        ]
-        second_pass = [
-            climate_gen.get_tile(q, r, TerrainType.PLAINS, 0.5)
-            for q, r in coords
-        ]
+        expected = {coord: climate_gen.get_tile(*coord, TerrainType.PLAINS, 0.5) for coord in coords}
+
+        for coord in coords:
+            with self.subTest(coord=coord):
+                self.assertEqual(climate_gen.get_tile(*coord, TerrainType.PLAINS, 0.5), expected[coord])
+
+    def test_bulk_tiles_match_single_tile_lookups(self) -> None:
+        config = cached_world_config(WorldProfile.DEV)
+        bulk_gen = ClimateGen(seed=9001, config=config)
+        single_gen = ClimateGen(seed=9001, config=config)
 
-        self.assertEqual(first_pass, second_pass)
+        qs = [-12, 0, 19, 7, 3]
+        rs = [4, 0, -8, 13, config.r_max + 5]
+        terrains = [TerrainType.PLAINS, TerrainType.OCEAN, TerrainType.HILLS, TerrainType.COAST, TerrainType.PLAINS]
+        heights = [0.5, 0.2, 0.7, 0.4, 0.5]
+        heats, moistures, biome_ids = bulk_gen.get_tiles_bulk(qs, rs, terrains, heights)
+
+        expected = [single_gen.get_tile(*args) for args in zip(qs, rs, terrains, heights)]
+        self.assertEqual(heats, [tile.heat for tile in expected])
+        self.assertEqual(moistures, [tile.moisture for tile in expected])
+        self.assertEqual([BIOME_TYPES[biome_id] for biome_id in biome_ids], [tile.biome_type for tile in expected])
 
     def test_heat_and_moisture_are_bounded(self) -> None:
-        climate_gen = ClimateGen(seed=1338, config=build_world_config(WorldProfile.DEV))
+        climate_gen = shared_model(ClimateGen, 1338)
 
         terrain_cycle = [
             TerrainType.PLAINS,
@@ -35,69 +56,56 @@ class TestClimateGen(unittest.TestCase):
             TerrainType.COAST,
             TerrainType.SNOW,
         ]
-        for q in range(-20, 21, 2):
-            for r in range(-20, 21, 2):
-                terrain = terrain_cycle[(q + r) % len(terrain_cycle)]
-                tile = climate_gen.get_tile(q, r, terrain, 0.5)
-                self.assertGreaterEqual(tile.heat, 0.0)
-                self.assertLessEqual(tile.heat, 1.0)
-                self.assertGreaterEqual(tile.moisture, 0.0)
-                self.assertLessEqual(tile.moisture, 1.0)
+        qs, rs = _sample_grid(range(-20, 21, 2), range(-20, 21, 2))
+        terrains = [terrain_cycle[(q + r) % len(terrain_cycle)] for q, r in zip(qs, rs)]
+        heats, moistures, _ = climate_gen.get_tiles_bulk(qs, rs, terrains, [0.5] * len(qs))
+
+        self.assertGreaterEqual(min(heats), 0.0)
+        self.assertLessEqual(max(heats), 1.0)
+        self.assertGreaterEqual(min(moistures), 0.0)
+        self.assertLessEqual(max(moistures), 1.0)
 
     def test_ocean_tiles_are_ocean_biome(self) -> None:
-        climate_gen = ClimateGen(seed=42, config=build_world_config(WorldProfile.DEV))
+        climate_gen = shared_model(ClimateGen, 42)
+
+        qs, rs = _sample_grid(range(-30, 31, 3), range(-30, 31, 3))
+        _, _, biome_ids = climate_gen.get_tiles_bulk(qs, rs, [TerrainType.OCEAN] * len(qs), [0.1] * len(qs))
 
-        for q in range(-30, 31, 3):
-            for r in range(-30, 31, 3):
-                tile = climate_gen.get_tile(q, r, TerrainType.OCEAN, 0.1)
-                self.assertEqual(tile.biome_type, BiomeType.OCEAN)
+        self.assertEqual({BIOME_TYPES[biome_id] for biome_id in biome_ids}, {BiomeType.OCEAN})
 
     def test_higher_altitude_is_cooler_on_average(self) -> None:
-        climate_gen = ClimateGen(seed=77, config=build_world_config(WorldProfile.DEV))
+        climate_gen = shared_model(ClimateGen, 77)
 
-        low_samples = []
-        high_samples = []
-        for q in range(-24, 25, 2):
-            for r in range(-24, 25, 2):
-                low_samples.append(climate_gen.get_tile(q, r, TerrainType.PLAINS, 0.15).heat)
-                high_samples.append(climate_gen.get_tile(q, r, TerrainType.PLAINS, 0.92).heat)
+        qs, rs = _sample_grid(range(-24, 25, 2), range(-24, 25, 2))
+        plains = [TerrainType.PLAINS] * len(qs)
+        low_samples, _, _ = climate_gen.get_tiles_bulk(qs, rs, plains, [0.15] * len(qs))
+        high_samples, _, _ = climate_gen.get_tiles_bulk(qs, rs, plains, [0.92] * len(qs))
 
-        low_avg = sum(low_samples) / len(low_samples)
-        high_avg = sum(high_samples) / len(high_samples)
-        self.assertLess(high_avg, low_avg)
+        self.assertLess(fmean(high_samples), fmean(low_samples))
 
     def test_rainshadow_can_reduce_moisture_deterministically(self) -> None:
-        class StubClimateGen(ClimateGen):
-            def _noise01(self, channel: str, q: int, r: int) -> float:
-                return 0.5
-
-            def _ocean_fetch_bonus(self, q: int, r: int, wind_dir: int) -> float:
-                return 0.0
-
-            def _scan_barrier_strength(self, q: int, r: int, direction: int) -> float:
-                if direction > 0:
-                    return 1.0
-                return 0.0
-
-        class WetStubClimateGen(StubClimateGen):
-            def _scan_barrier_strength(self, q: int, r: int, direction: int) -> float:
-                if direction < 0:
-                    return 1.0
-                return 0.0
-
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
         mid_lat_r = int((config.r_min + config.r_max) / 2) + int(config.height * 0.22)
 
-        dry_leeward = StubClimateGen(seed=1, config=config).get_tile(
-            8, mid_lat_r, TerrainType.PLAINS, 0.4
-        ).moisture
-        wetter_windward = WetStubClimateGen(seed=1, config=config).get_tile(
-            8, mid_lat_r, TerrainType.PLAINS, 0.4
-        ).moisture
+        def moisture_with_barrier(barrier_side: int) -> float:
+            # Fresh instance per scenario: patched values must not reach the shared caches.
+            climate_gen = ClimateGen(seed=1, config=config)
+            with patch.multiple(
+                climate_gen,
+                _noise01=Mock(return_value=0.5),
+                _ocean_fetch_bonus=Mock(return_value=0.0),
+                _scan_barrier_strength=Mock(
+                    side_effect=lambda q, r, direction: 1.0 if direction * barrier_side > 0 else 0.0
+                ),
+            ):
+                return climate_gen.get_tile(8, mid_lat_r, TerrainType.PLAINS, 0.4).moisture
+
+        dry_leeward = moisture_with_barrier(1)
+        wetter_windward = moisture_with_barrier(-1)
         self.assertLess(dry_leeward, wetter_windward)
 
     def test_orographic_and_coastal_moisture_bias(self) -> None:
-        climate_gen = ClimateGen(seed=909, config=build_world_config(WorldProfile.DEV))
+        climate_gen = shared_model(ClimateGen, 909)
 
         coast = climate_gen.get_tile(3, -4, TerrainType.COAST, 0.3).moisture
         inland = climate_gen.get_tile(3, -4, TerrainType.PLAINS, 0.3).moisture
@@ -108,29 +116,64 @@ class TestClimateGen(unittest.TestCase):
         self.assertGreaterEqual(mountain, plains)
 
     def test_climate_cache_uses_canonical_wrap_x_key(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
         climate_gen = ClimateGen(seed=909, config=config)
 
         base_q, base_r = 21, -11
         wrapped_q = base_q + config.width
 
         climate_gen.get_tile(base_q, base_r, TerrainType.PLAINS, 0.45)
-        cache_size_after_first = len(climate_gen._climate_cache)
+        cache_size_after_first = climate_gen.cached_tile_count()
         climate_gen.get_tile(wrapped_q, base_r, TerrainType.PLAINS, 0.45)
 
-        self.assertEqual(len(climate_gen._climate_cache), cache_size_after_first)
+        self.assertEqual(cache_size_after_first, 1)
+        self.assertEqual(climate_gen.cached_tile_count(), cache_size_after_first)
+
+    def test_dense_cells_recompute_when_terrain_or_height_changes(self) -> None:
+        climate_gen = ClimateGen(seed=909, config=cached_world_config(WorldProfile.DEV))
+        reference_gen = ClimateGen(seed=909, config=cached_world_config(WorldProfile.DEV))
+
+        climate_gen.get_tile(5, 3, TerrainType.PLAINS, 0.45)
+        coast = climate_gen.get_tile(5, 3, TerrainType.COAST, 0.45)
+        higher = climate_gen.get_tile(5, 3, TerrainType.COAST, 0.9)
+
+        self.assertEqual(coast, reference_gen.get_tile(5, 3, TerrainType.COAST, 0.45))
+        self.assertEqual(higher, reference_gen.get_tile(5, 3, TerrainType.COAST, 0.9))
+        self.assertEqual(climate_gen.cached_tile_count(), 1)
+
+    def test_climate_cache_is_bounded(self) -> None:
+        # Worlds too large for dense per-cell storage fall back to the bounded dict cache.
+        climate_gen = ClimateGen(seed=909, config=build_world_config(WorldProfile.TARGET))
+        self.assertFalse(climate_gen._dense)
+        climate_gen._cache_maxsize = 16
+
+        first = climate_gen.get_tile(0, 0, TerrainType.PLAINS, 0.45)
+        for q in range(1, 40):
+            climate_gen.get_tile(q, 0, TerrainType.PLAINS, 0.45)
+
+        self.assertEqual(len(climate_gen._climate_cache), 16)
+        self.assertNotIn((0, 0), climate_gen._climate_cache)
+        self.assertEqual(climate_gen.get_tile(0, 0, TerrainType.PLAINS, 0.45), first)
 
     def test_wrap_x_is_deterministic_for_climate(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        climate_gen = ClimateGen(seed=909, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        climate_gen = shared_model(ClimateGen, 909)
 
         first = climate_gen.get_tile(10, 4, TerrainType.PLAINS, 0.4)
         wrapped = climate_gen.get_tile(10 + config.width, 4, TerrainType.PLAINS, 0.4)
         self.assertEqual(first, wrapped)
 
+        # Whole column 10 against its wrapped copy, one bulk call per side.
+        rs = list(range(config.r_min, config.r_max + 1))
+        terrains = [TerrainType.PLAINS] * len(rs)
+        heights = [0.4] * len(rs)
+        base = climate_gen.get_tiles_bulk([10] * len(rs), rs, terrains, heights)
+        shifted = climate_gen.get_tiles_bulk([10 + config.width] * len(rs), rs, terrains, heights)
+        self.assertEqual(base, shifted)
+
     def test_wind_bands_follow_expected_zonal_directions(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        climate_gen = ClimateGen(seed=909, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        climate_gen = shared_model(ClimateGen, 909)
 
         equator_r = int((config.r_min + config.r_max) / 2)
         tropical_r = equator_r
@@ -142,8 +185,8 @@ class TestClimateGen(unittest.TestCase):
         self.assertEqual(climate_gen.wind_band_label(polar_r), "E->W")
 
     def test_ocean_fetch_wrap_and_downwind_moisture_bias(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        climate_gen = ClimateGen(seed=909, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        climate_gen = shared_model(ClimateGen, 909)
 
         found_pair: tuple[int, int, int] | None = None
         equator_r = int((config.r_min + config.r_max) / 2)
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import unittest
 
-from hexcrawl.world.world_config import WorldProfile, build_world_config
+from hexcrawl.world.world_config import WorldConfig, WorldProfile
 from hexcrawl.world.worldgen import WorldGen
+from tests._helpers import shared_model
 
 
 class TestErosion(unittest.TestCase):
     def test_deterministic_eroded_height(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
 
         coords = [(-18, 7), (0, 0), (26, -10), (15, 23)]
         first = [world_gen.get_tile(q, r).height for q, r in coords]
@@ -19,7 +20,7 @@ class TestErosion(unittest.TestCase):
         self.assertEqual(first, second)
 
     def test_eroded_height_is_bounded(self) -> None:
-        world_gen = WorldGen(seed=2025, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 2025)
 
         for q in range(-30, 31, 6):
             for r in range(-24, 25, 6):
@@ -28,19 +29,13 @@ class TestErosion(unittest.TestCase):
                 self.assertLessEqual(height, 1.0)
 
     def test_river_carving_effect_on_high_strength_tile(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
-
-        sample = None
-        best_strength = -1
-        for q in range(-80, 81, 4):
-            for r in range(-60, 61, 4):
-                strength = world_gen.get_river_strength(q, r)
-                if strength > best_strength:
-                    best_strength = strength
-                    sample = (q, r)
-
-        self.assertIsNotNone(sample, msg="No sampled river tile found")
-        q, r = sample
+        world_gen = shared_model(WorldGen, 1337)
+
+        # max() keeps the first strongest sample, matching a strict > scan in q-major order.
+        best_strength, q, r = max(
+            ((world_gen.get_river_strength(q, r), q, r) for q in range(-80, 81, 4) for r in range(-60, 61, 4)),
+            key=lambda sample: sample[0],
+        )
         self.assertGreaterEqual(best_strength, 180, msg="No sufficiently strong river found in bounded search")
 
         canonical = world_gen.config.canonicalize(q, r)
@@ -51,6 +46,17 @@ class TestErosion(unittest.TestCase):
         eroded_height = world_gen.get_tile(cq, cr).height
         self.assertLessEqual(eroded_height, base_height)
 
+    def test_whole_grid_build_matches_per_tile_erosion(self) -> None:
+        config = WorldConfig(profile=WorldProfile.DEV, width=32, height=16)
+        dense = WorldGen(seed=404, config=config)
+        lazy = WorldGen(seed=404, config=config)
+        lazy._erosion._dense = False
+
+        for r in range(config.r_min, config.r_max + 1):
+            for q in range(config.q_min, config.q_max + 1):
+                self.assertEqual(dense._erosion.eroded_height(q, r), lazy._erosion.eroded_height(q, r))
+                self.assertEqual(dense.get_valley_strength(q, r), lazy.get_valley_strength(q, r))
+
 
 if __name__ == "__main__":
     unittest.main()
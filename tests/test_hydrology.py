@@ -4,7 +4,16 @@ from __future__ import annotations
 
 import unittest
 
-from hexcrawl.world.hydrology import HydrologyModel
+from hexcrawl.core.hex_math import axial_neighbor_strides
+from hexcrawl.world.hydrology import (
+    _NO_FLOW,
+    _SINK,
+    HydrologyModel,
+    _accumulate,
+    _break_cycles,
+    _compute_flow_dirs,
+    _overflow_step,
+)
 from hexcrawl.world.world_config import WorldConfig, WorldProfile
 
 
@@ -47,6 +56,29 @@ class TestHydrology(unittest.TestCase):
         self.assertIsNone(model.flow_to(q, ocean_r))
         self.assertEqual(model.river_strength(q, ocean_r), 0)
 
+    def test_ocean_threshold_matches_equivalent_ocean_fn(self) -> None:
+        config = self._build_config()
+
+        def height_fn(q: int, r: int) -> float:
+            return ((q * 7 + r * 13) % 11) / 11.0
+
+        by_fn = HydrologyModel(
+            seed=5,
+            config=config,
+            height_fn=height_fn,
+            is_ocean_fn=lambda q, r: height_fn(q, r) < 0.3,
+        )
+        by_threshold = HydrologyModel(seed=5, config=config, height_fn=height_fn, ocean_threshold=0.3)
+
+        for r in range(config.r_min, config.r_max + 1):
+            for q in range(config.q_min, config.q_max + 1):
+                self.assertEqual(by_threshold.flow_to(q, r), by_fn.flow_to(q, r))
+                self.assertEqual(by_threshold.is_lake(q, r), by_fn.is_lake(q, r))
+                self.assertEqual(by_threshold.river_strength(q, r), by_fn.river_strength(q, r))
+
+        with self.assertRaises(ValueError):
+            HydrologyModel(seed=5, config=config, height_fn=height_fn)
+
     def test_target_guard_skips_global_build_without_crash(self) -> None:
         config = WorldConfig(profile=WorldProfile.TARGET, width=8, height=6)
 
@@ -75,11 +107,17 @@ class TestHydrology(unittest.TestCase):
             is_ocean_fn=lambda q, r: False,
         )
 
-        q, r = 1, 0
-        self.assertEqual(model.flow_to(q, r), model.flow_to(q + config.width, r))
-        self.assertEqual(model.accumulation(q, r), model.accumulation(q + config.width, r))
-        self.assertEqual(model.river_strength(q, r), model.river_strength(q + config.width, r))
-        self.assertEqual(model.is_lake(q, r), model.is_lake(q + config.width, r))
+        # Every cell against its wrapped copy, one list comparison per query.
+        cells = [
+            (q, r)
+            for r in range(config.r_min, config.r_max + 1)
+            for q in range(config.q_min, config.q_max + 1)
+        ]
+        for query in (model.flow_to, model.accumulation, model.river_strength, model.is_lake):
+            self.assertEqual(
+                [query(q, r) for q, r in cells],
+                [query(q + config.width, r) for q, r in cells],
+            )
 
     def test_sink_overflow_finds_outlet_within_radius(self) -> None:
         config = WorldConfig(profile=WorldProfile.DEV, width=5, height=5)
@@ -129,6 +167,63 @@ class TestHydrology(unittest.TestCase):
 
         self.assertEqual(model_a.flow_to(0, 0), model_b.flow_to(0, 0))
 
+    def test_accumulation_handles_chains_deeper_than_recursion_limit(self) -> None:
+        length = 20_000
+        flow = list(range(1, length)) + [-1]
+        is_ocean = bytearray(length)
+        is_ocean[-1] = 1
+
+        accum = _accumulate(flow, is_ocean)
+
+        self.assertEqual(accum[0], 1)
+        self.assertEqual(accum[length - 2], length - 1)
+        self.assertEqual(accum[-1], length - 1)
+
+    def test_break_cycles_cuts_long_loop_without_recursion(self) -> None:
+        length = 20_000
+        flow = list(range(1, length)) + [0]
+
+        _break_cycles(flow)
+
+        self.assertEqual(flow[-1], _NO_FLOW)
+        self.assertEqual(flow[:-1], list(range(1, length)))
+
+    def test_capped_world_chunks_match_full_grid_kernels(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.TARGET, width=150, height=70, wrap_x=wrap_x)
+            nodes = [
+                (q, r)
+                for r in range(config.r_min, config.r_max + 1)
+                for q in range(config.q_min, config.q_max + 1)
+            ]
+            # Coarse pseudo-random terrain with plenty of sinks and flat ties.
+            heights = [((q * 7919 + r * 104729) % 23) / 23.0 for q, r in nodes]
+            is_ocean = bytearray(value < 0.1 for value in heights)
+            model = HydrologyModel(
+                seed=3,
+                config=config,
+                height_fn=lambda q, r: heights[config.index(q, r)],
+                is_ocean_fn=lambda q, r: bool(is_ocean[config.index(q, r)]),
+                overflow_radius=4,
+            )
+            model._supports_global_build = False
+            model._chunk_cache_maxsize = 2
+
+            flow = _compute_flow_dirs(heights, is_ocean, config.width, config.height, wrap_x)
+            row_strides = axial_neighbor_strides(config.width, config.height, wrap_x)
+            self.assertIn(_SINK, flow)
+            for idx, downstream in enumerate(flow):
+                if downstream == _SINK:
+                    flow[idx] = _overflow_step(
+                        idx, heights[idx], heights, is_ocean, config.width, row_strides, 4
+                    )
+
+            for idx, (q, r) in enumerate(nodes):
+                expected = None if flow[idx] < 0 else config.decode(flow[idx])
+                self.assertEqual(model.flow_to(q, r), expected)
+                self.assertEqual(model.is_lake(q, r), (not is_ocean[idx]) and expected is None)
+            self.assertLessEqual(len(model._chunk_cache), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,31 +4,43 @@ from __future__ import annotations
 
 import unittest
 
-from hexcrawl.world.tectonics import BoundaryKind, PlateData, PlateType, TectonicsModel
-from hexcrawl.world.world_config import WorldProfile, build_world_config
+from hexcrawl.core.hex_math import AXIAL_DIRECTIONS
+from hexcrawl.world.tectonics import BoundaryData, BoundaryKind, PlateData, PlateType, TectonicsModel
+from hexcrawl.world.world_config import WorldConfig, WorldProfile, build_world_config
+from tests._helpers import cached_world_config, shared_model
 
 
 class TestTectonics(unittest.TestCase):
     def test_deterministic_plate_and_boundary_outputs(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        first = TectonicsModel(seed=1337, config=config)
-        second = TectonicsModel(seed=1337, config=config)
+        first = shared_model(TectonicsModel, 1337)
+        second = TectonicsModel(seed=1337, config=cached_world_config(WorldProfile.DEV))
 
         coords = [(-25, 8), (0, 0), (13, 17), (87, -30)]
         for q, r in coords:
-            self.assertEqual(first.plate_at(q, r), second.plate_at(q, r))
-            self.assertEqual(first.boundary_at(q, r), second.boundary_at(q, r))
+            with self.subTest(q=q, r=r):
+                self.assertEqual(first.plate_at(q, r), second.plate_at(q, r))
+                self.assertEqual(first.boundary_at(q, r), second.boundary_at(q, r))
+
+        # Whole-grid check on a small world: compare the dense per-cell plate ids in one go.
+        config = WorldConfig(profile=WorldProfile.DEV, width=64, height=32)
+        grids = []
+        for _ in range(2):
+            tectonics = TectonicsModel(seed=1337, config=config)
+            for r in range(config.r_min, config.r_max + 1):
+                for q in range(config.q_min, config.q_max + 1):
+                    tectonics.plate_at(q, r)
+            grids.append(tectonics._plate_ids)
+        self.assertEqual(grids[0], grids[1])
 
     def test_wrap_x_plate_identity(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        tectonics = TectonicsModel(seed=2025, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        tectonics = shared_model(TectonicsModel, 2025)
 
         q, r = 22, -11
         self.assertEqual(tectonics.plate_at(q, r), tectonics.plate_at(q + config.width, r))
 
     def test_plate_diversity_in_sample_window(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        tectonics = TectonicsModel(seed=1, config=config)
+        tectonics = shared_model(TectonicsModel, 1)
 
         found_plate_ids: set[int] = set()
         for q in range(-40, 41, 4):
@@ -40,8 +52,7 @@ class TestTectonics(unittest.TestCase):
         self.assertGreaterEqual(len(found_plate_ids), 3)
 
     def test_boundary_kind_and_strength_ranges(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        tectonics = TectonicsModel(seed=42, config=config)
+        tectonics = shared_model(TectonicsModel, 42)
 
         for q in range(-20, 21, 5):
             for r in range(-20, 21, 5):
@@ -51,8 +62,7 @@ class TestTectonics(unittest.TestCase):
                 self.assertLessEqual(boundary.strength, 1.0)
 
     def test_boundary_classification_sign_regression(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        tectonics = TectonicsModel(seed=7, config=config)
+        tectonics = shared_model(TectonicsModel, 7)
 
         convergent, _ = tectonics._classify_boundary(
             current=PlateData(plate_id=1, plate_type=PlateType.CONTINENTAL, motion=(1, 0)),
@@ -68,27 +78,77 @@ class TestTectonics(unittest.TestCase):
         self.assertEqual(convergent, BoundaryKind.CONVERGENT)
         self.assertEqual(divergent, BoundaryKind.DIVERGENT)
 
+    def test_boundary_lut_matches_direct_classification(self) -> None:
+        tectonics = shared_model(TectonicsModel, 7)
+        motion_idx = tectonics._plate_motion_idx
+        plate_ids = range(min(8, len(tectonics._plates)))
+
+        for a in plate_ids:
+            for b in plate_ids:
+                if a == b:
+                    continue
+                for direction_idx, direction in enumerate(AXIAL_DIRECTIONS):
+                    kind, strength = tectonics._classify_boundary(tectonics._plates[a], tectonics._plates[b], direction)
+                    self.assertEqual(
+                        tectonics._boundary_lut[(motion_idx[a] * 6 + motion_idx[b]) * 6 + direction_idx],
+                        BoundaryData(kind=kind, strength=strength),
+                    )
+
     def test_caches_are_bounded_and_canonicalized(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
         tectonics = TectonicsModel(seed=9, config=config)
 
         self.assertEqual(tectonics._cache_maxsize, config.width * config.height)
+        self.assertTrue(tectonics._dense)
 
         q, r = 25, 10
         tectonics.plate_at(q, r)
         tectonics.plate_at(q + config.width, r)
-        self.assertEqual(len(tectonics._plate_cache), 1)
+        self.assertEqual(tectonics.cached_plate_count(), 1)
+
+    def test_capped_world_caches_stay_bounded(self) -> None:
+        config = build_world_config(WorldProfile.TARGET)
+        tectonics = TectonicsModel(seed=9, config=config)
+        self.assertFalse(tectonics._dense)
 
-        maxsize = tectonics._cache_maxsize
+        maxsize = 50
+        tectonics._cache_maxsize = maxsize
         for i in range(maxsize + 25):
             cq = config.q_min + (i % config.width)
-            cr = config.r_min + ((i // config.width) % config.height)
-            tectonics.plate_at(cq, cr)
-            tectonics.boundary_at(cq, cr)
+            tectonics.plate_at(cq, 0)
+            tectonics.boundary_at(cq, 0)
 
         self.assertLessEqual(len(tectonics._plate_cache), maxsize)
         self.assertLessEqual(len(tectonics._boundary_cache), maxsize)
 
+    def test_dense_and_capped_paths_agree(self) -> None:
+        config = WorldConfig(profile=WorldProfile.DEV, width=48, height=24)
+        dense = TectonicsModel(seed=31, config=config)
+        capped = TectonicsModel(seed=31, config=config)
+        capped._dense = False
+        capped._cache_maxsize = 64
+
+        for r in range(config.r_min, config.r_max + 1):
+            for q in range(config.q_min - 2, config.q_max + 3):
+                self.assertEqual(dense.plate_at(q, r), capped.plate_at(q, r))
+                self.assertEqual(dense.boundary_at(q, r), capped.boundary_at(q, r))
+
+    def test_nearest_seed_matches_exhaustive_scan(self) -> None:
+        for config in (
+            WorldConfig(profile=WorldProfile.DEV, width=96, height=48),
+            WorldConfig(profile=WorldProfile.DEV, width=7, height=5),
+        ):
+            tectonics = TectonicsModel(seed=12, config=config)
+            for r in range(config.r_min, config.r_max + 1):
+                for q in range(config.q_min, config.q_max + 1):
+                    expected = min(
+                        ((q - sq - wrap) ** 2 + (r - sr) ** 2, plate_id, sq, sr, wrap)
+                        for plate_id, sq, sr in tectonics._seeds
+                        for wrap in (-config.width, 0, config.width)
+                    )
+                    dist_sq, plate_id, sq, sr, wrap = expected
+                    self.assertEqual(tectonics._nearest_seed(q, r), (plate_id, sq, sr, wrap, dist_sq))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import unittest
 
-from hexcrawl.world.world_config import WorldProfile, build_world_config
+from hexcrawl.world.world_config import WorldConfig, WorldProfile
+from tests._helpers import cached_world_config
 
 
 class TestWorldConfig(unittest.TestCase):
     def test_wrap_x_canonicalizes_multiple_offsets(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
         q_min = config.q_min
         q_max = config.q_max
 
@@ -19,13 +20,29 @@ class TestWorldConfig(unittest.TestCase):
         self.assertEqual(config.canonicalize(q_min + config.width * 3 + 7, 0), (q_min + 7, 0))
 
     def test_out_of_bounds_r_is_rejected(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
 
         self.assertIsNone(config.canonicalize(0, config.r_min - 1))
         self.assertIsNone(config.canonicalize(0, config.r_max + 1))
         self.assertEqual(config.canonicalize(0, config.r_min), (0, config.r_min))
         self.assertEqual(config.canonicalize(0, config.r_max), (0, config.r_max))
 
+    def test_encode_matches_canonicalize_and_round_trips(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.DEV, width=12, height=6, wrap_x=wrap_x)
+            seen: set[int] = set()
+            for r in range(config.r_min - 1, config.r_max + 2):
+                for q in range(config.q_min - 30, config.q_max + 31):
+                    canonical = config.canonicalize(q, r)
+                    index = config.encode(q, r)
+                    if canonical is None:
+                        self.assertIsNone(index)
+                        continue
+                    self.assertEqual(index, config.index(*canonical))
+                    self.assertEqual(config.decode(index), canonical)
+                    seen.add(index)
+            self.assertEqual(seen, set(range(config.width * config.height)))
+
 
 if __name__ == "__main__":
     unittest.main()
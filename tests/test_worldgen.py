@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import math
 import unittest
+from statistics import fmean
 
 from hexcrawl.core.hex_math import AXIAL_DIRECTIONS
 from hexcrawl.world.tectonics import BoundaryKind
-from hexcrawl.world.world_config import WorldProfile, build_world_config
-from hexcrawl.world.worldgen import TerrainType, WorldGen
+from hexcrawl.world.world_config import WorldConfig, WorldProfile
+from hexcrawl.world.worldgen import TERRAIN_TYPES, TerrainType, WorldGen
+from tests._helpers import cached_world_config, shared_model
 
 
 class TestWorldGen(unittest.TestCase):
     def test_deterministic_outputs(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
 
         coords = [(-12, 4), (0, 0), (19, -8), (7, 13)]
         first_pass = [world_gen.get_tile(q, r) for q, r in coords]
@@ -21,40 +24,44 @@ class TestWorldGen(unittest.TestCase):
         self.assertEqual(first_pass, second_pass)
 
     def test_height_is_bounded(self) -> None:
-        world_gen = WorldGen(seed=2025, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 2025)
 
-        for q in range(-20, 21, 2):
-            for r in range(-20, 21, 2):
-                height = world_gen.get_tile(q, r).height
-                self.assertGreaterEqual(height, 0.0)
-                self.assertLessEqual(height, 1.0)
+        heights = [world_gen.get_tile(q, r).height for q in range(-20, 21, 2) for r in range(-20, 21, 2)]
+
+        self.assertGreaterEqual(min(heights), 0.0)
+        self.assertLessEqual(max(heights), 1.0)
 
     def test_coast_has_ocean_neighbor(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
+
+        # Terrain for the window plus a one-hex border, fetched once; neighbor checks are lookups.
+        terrain = {
+            (q, r): world_gen.get_tile(q, r).terrain_type
+            for q in range(-31, 32)
+            for r in range(-31, 32)
+        }
 
         for q in range(-30, 31):
             for r in range(-30, 31):
-                tile = world_gen.get_tile(q, r)
-                if tile.terrain_type != TerrainType.COAST:
+                if terrain[(q, r)] != TerrainType.COAST:
                     continue
 
                 has_ocean_neighbor = any(
-                    world_gen.get_tile(q + dq, r + dr).terrain_type == TerrainType.OCEAN
-                    for dq, dr in AXIAL_DIRECTIONS
+                    terrain[(q + dq, r + dr)] == TerrainType.OCEAN for dq, dr in AXIAL_DIRECTIONS
                 )
                 self.assertTrue(has_ocean_neighbor, msg=f"COAST without OCEAN neighbor at {(q, r)}")
 
     def test_wrap_x_returns_same_tile(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        world_gen = WorldGen(seed=1337, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        world_gen = shared_model(WorldGen, 1337)
 
         base_q, base_r = 17, 22
         wrapped_q = base_q + config.width
         self.assertEqual(world_gen.get_tile(base_q, base_r), world_gen.get_tile(wrapped_q, base_r))
 
     def test_wrap_x_consistency_across_sample_window(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        world_gen = WorldGen(seed=2025, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        world_gen = shared_model(WorldGen, 2025)
 
         for q in range(-40, 41, 10):
             for r in range(-30, 31, 10):
@@ -64,8 +71,8 @@ class TestWorldGen(unittest.TestCase):
                 )
 
     def test_wrap_x_river_strength_consistency(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        world_gen = WorldGen(seed=1337, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        world_gen = shared_model(WorldGen, 1337)
 
         for q in range(-40, 41, 20):
             for r in range(-30, 31, 15):
@@ -75,8 +82,8 @@ class TestWorldGen(unittest.TestCase):
                 )
 
     def test_wrap_x_valley_strength_consistency(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        world_gen = WorldGen(seed=1337, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        world_gen = shared_model(WorldGen, 1337)
 
         for q in range(-40, 41, 20):
             for r in range(-30, 31, 15):
@@ -86,7 +93,7 @@ class TestWorldGen(unittest.TestCase):
                 )
 
     def test_worldgen_cache_uses_canonical_wrap_x_key(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
+        config = cached_world_config(WorldProfile.DEV)
         world_gen = WorldGen(seed=1337, config=config)
 
         base_q, base_r = 15, 9
@@ -98,9 +105,35 @@ class TestWorldGen(unittest.TestCase):
 
         self.assertEqual(len(world_gen._tile_cache), cache_size_after_first)
 
+    def test_tile_cache_is_bounded(self) -> None:
+        world_gen = WorldGen(seed=909, config=cached_world_config(WorldProfile.TARGET))
+        world_gen._tile_cache_maxsize = 16
+
+        first = world_gen.get_tile(0, 0)
+        for q in range(1, 40):
+            world_gen.get_tile(q, 0)
+
+        self.assertEqual(len(world_gen._tile_cache), 16)
+        self.assertNotIn(world_gen.config.index(0, 0), world_gen._tile_cache)
+        self.assertEqual(world_gen.get_tile(0, 0), first)
+
+    def test_dev_world_keeps_heights_in_dense_grids(self) -> None:
+        config = WorldConfig(profile=WorldProfile.DEV, width=64, height=32)
+        world_gen = WorldGen(seed=1337, config=config)
+
+        tile = world_gen.get_tile(3, -4)
+        filled = world_gen.cached_height_count()
+        world_gen.get_tile(3 + config.width, -4)
+
+        self.assertEqual(world_gen._heights[config.index(3, -4)], tile.height)
+        self.assertGreaterEqual(filled, 1)
+        self.assertEqual(world_gen.cached_height_count(), filled)
+        self.assertGreater(world_gen.cached_raw_height_count(), 0)
+        self.assertEqual(world_gen._height_cache, {})
+        self.assertEqual(world_gen._raw_height_cache, {})
 
     def test_lattice_noise_does_not_wrap_y_when_wrap_y_disabled(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
 
         freq = 4
         ix = 7
@@ -112,28 +145,52 @@ class TestWorldGen(unittest.TestCase):
 
         self.assertNotEqual(base, shifted)
 
+    def test_lattice_rows_match_hashed_lattice_noise(self) -> None:
+        for wrap_y in (False, True):
+            config = WorldConfig(profile=WorldProfile.DEV, width=64, height=32, wrap_y=wrap_y)
+            world_gen = WorldGen(seed=1337, config=config)
+
+            for freq, rows in world_gen._lattice_rows.items():
+                y_period = freq if wrap_y else None
+                self.assertEqual(len(rows), freq + 1)
+                for iy, row in enumerate(rows):
+                    for ix, value in enumerate(row):
+                        self.assertEqual(value, world_gen._lattice_noise(ix, iy, freq, y_period))
+
+    def test_inlined_fbm_matches_value_noise_octaves(self) -> None:
+        world_gen = shared_model(WorldGen, 2025)
+
+        for x, y in ((0.0, 0.0), (0.31, 0.77), (0.999, 0.5), (0.5, 0.999), (0.125, 0.0625)):
+            octaves = [world_gen._value_noise(x, y, freq) for freq in (2, 4, 8, 16)]
+            total = sum(amp * noise for amp, noise in zip((0.60, 0.25, 0.10, 0.05), octaves))
+            total = (total * 0.70) + (octaves[0] * 0.30)
+            self.assertAlmostEqual(world_gen._fbm_noise(x, y), total, places=12)
+
+        for row, y in enumerate(world_gen._norm_ys):
+            self.assertEqual(world_gen._radial_terms[row], 0.08 * abs(math.sin((y - 0.5) * math.pi)))
+
     def test_height_neighbor_correlation(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
+        config = world_gen.config
+        # One whole-grid pass, then plain index reads (row-major, WorldConfig.encode).
+        heights, _ = world_gen.build_arrays()
 
         near_diffs: list[float] = []
         far_diffs: list[float] = []
 
         for q in range(-80, 81, 8):
             for r in range(-60, 61, 8):
-                here = world_gen.get_tile(q, r).height
-                near = world_gen.get_tile(q + 1, r).height
-                far = world_gen.get_tile(q + 64, r + 32).height
+                here = heights[config.encode(q, r)]
+                near = heights[config.encode(q + 1, r)]
+                far = heights[config.encode(q + 64, r + 32)]
                 near_diffs.append(abs(here - near))
                 far_diffs.append(abs(here - far))
 
-        mean_near = sum(near_diffs) / len(near_diffs)
-        mean_far = sum(far_diffs) / len(far_diffs)
-
-        self.assertLess(mean_near, mean_far)
+        self.assertLess(fmean(near_diffs), fmean(far_diffs))
 
 
     def test_boundary_falloff_influences_non_boundary_tile(self) -> None:
-        world_gen = WorldGen(seed=1337, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 1337)
 
         found = False
         for q in range(-60, 61):
@@ -160,8 +217,33 @@ class TestWorldGen(unittest.TestCase):
 
         self.assertTrue(found, msg="No suitable convergent-boundary sample found for falloff test")
 
+    def test_boundary_falloff_matches_direct_window_scan(self) -> None:
+        for profile in (WorldProfile.DEV, WorldProfile.TARGET):
+            config = WorldConfig(profile=profile, width=48, height=24, wrap_x=profile == WorldProfile.DEV)
+            world_gen = WorldGen(seed=2025, config=config)
+            tectonics = world_gen._tectonics
+            radius = world_gen.BOUNDARY_FALLOFF_RADIUS
+
+            for q, r in ((0, 0), (config.q_min, 3), (config.q_max, -2), (5, config.r_min), (-7, config.r_max)):
+                weighted_sum = 0.0
+                total_weight = 0.0
+                for dq in range(-radius, radius + 1):
+                    for dr in range(-radius, radius + 1):
+                        distance = max(abs(dq), abs(dr), abs(dq + dr))
+                        sample = config.canonicalize(q + dq, r + dr)
+                        if distance > radius or sample is None:
+                            continue
+                        weight = (radius + 1 - distance) / (radius + 1)
+                        bias = world_gen._boundary_bias_at(
+                            sample[0], sample[1], tectonics.plate_at(*sample), tectonics.boundary_at(*sample)
+                        )
+                        weighted_sum += bias * weight
+                        total_weight += weight
+
+                self.assertEqual(world_gen._boundary_falloff_influence_at(q, r), weighted_sum / total_weight)
+
     def test_smoothed_height_uses_local_neighbor_band(self) -> None:
-        world_gen = WorldGen(seed=2025, config=build_world_config(WorldProfile.DEV))
+        world_gen = shared_model(WorldGen, 2025)
 
         found_difference = False
         for q in range(-50, 51, 5):
@@ -188,13 +270,96 @@ class TestWorldGen(unittest.TestCase):
 
         self.assertTrue(found_difference, msg="Smoothing never diverged from raw heights in sampled area")
 
+    def test_dense_smoothing_matches_capped_smoothing(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.DEV, width=24, height=12, wrap_x=wrap_x)
+            dense = WorldGen(seed=2025, config=config)
+            capped = WorldGen(seed=2025, config=config)
+            # Force the capped path: raw heights via the LRU dict and canonicalize.
+            capped._raw_heights = None
+
+            for r in range(config.r_min, config.r_max + 1):
+                for q in range(config.q_min, config.q_max + 1):
+                    self.assertEqual(dense._smoothed_height_at(q, r), capped._smoothed_height_at(q, r))
+
+    def test_dense_ocean_neighbor_matches_capped_scan(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.DEV, width=24, height=12, wrap_x=wrap_x)
+            dense = WorldGen(seed=1337, config=config)
+            capped = WorldGen(seed=1337, config=config)
+            # Force the capped path: final heights via the LRU dict and canonicalize.
+            capped._heights = None
+
+            for r in range(config.r_min, config.r_max + 1):
+                for q in range(config.q_min, config.q_max + 1):
+                    self.assertEqual(dense._has_ocean_neighbor(q, r), capped._has_ocean_neighbor(q, r))
+
     def test_out_of_bounds_r_defaults_to_ocean(self) -> None:
-        config = build_world_config(WorldProfile.DEV)
-        world_gen = WorldGen(seed=1337, config=config)
+        config = cached_world_config(WorldProfile.DEV)
+        world_gen = shared_model(WorldGen, 1337)
 
         self.assertEqual(world_gen.get_tile(0, config.r_max + 1).terrain_type, TerrainType.OCEAN)
         self.assertEqual(world_gen.get_tile(0, config.r_min - 1).terrain_type, TerrainType.OCEAN)
 
+    def test_terrain_id_matches_tile_terrain(self) -> None:
+        config = WorldConfig(profile=WorldProfile.DEV, width=32, height=16)
+        world_gen = WorldGen(seed=1337, config=config)
+
+        for q in range(config.q_min - 3, config.q_max + 4, 3):
+            for r in range(config.r_min - 1, config.r_max + 2):
+                terrain_id = world_gen.get_terrain_id(q, r)
+                self.assertEqual(TERRAIN_TYPES[terrain_id], world_gen.get_tile(q, r).terrain_type)
+
+    def test_dense_terrain_id_miss_classifies_whole_grid(self) -> None:
+        config = WorldConfig(profile=WorldProfile.DEV, width=32, height=16)
+        world_gen = WorldGen(seed=1337, config=config)
+
+        world_gen.get_terrain_id(0, 0)
+
+        self.assertNotIn(0xFF, world_gen._terrain_ids)
+        self.assertEqual(world_gen._tile_cache, {})
+
+    def test_build_arrays_matches_per_tile_generation(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.DEV, width=32, height=16, wrap_x=wrap_x)
+            heights, terrain_ids = WorldGen(seed=1337, config=config).build_arrays()
+            world_gen = WorldGen(seed=1337, config=config)
+
+            idx = 0
+            for r in range(config.r_min, config.r_max + 1):
+                for q in range(config.q_min, config.q_max + 1):
+                    tile = world_gen.get_tile(q, r)
+                    self.assertEqual(heights[idx], tile.height)
+                    self.assertEqual(TERRAIN_TYPES[terrain_ids[idx]], tile.terrain_type)
+                    idx += 1
+
+    def test_river_block_matches_per_hex_queries(self) -> None:
+        for wrap_x in (True, False):
+            config = WorldConfig(profile=WorldProfile.DEV, width=32, height=16, wrap_x=wrap_x)
+            world_gen = WorldGen(seed=1337, config=config)
+            capped = WorldGen(seed=1337, config=config)
+            # Force the per-hex fallback used by capped worlds.
+            capped._hydrology._supports_global_build = False
+
+            for q0, r0, q1, r1 in (
+                (config.q_min - 2, config.r_min - 1, config.q_max + 2, config.r_max + 1),
+                (config.q_min + 3, -2, config.q_min + 9, 4),
+            ):
+                block = world_gen.get_river_block(q0, r0, q1, r1)
+                capped_block = capped.get_river_block(q0, r0, q1, r1)
+
+                idx = 0
+                for r in range(r0, r1 + 1):
+                    for q in range(q0, q1 + 1):
+                        self.assertEqual(block.strength[idx], world_gen.get_river_strength(q, r))
+                        self.assertEqual(block.flow_to[idx], world_gen.get_flow_to(q, r))
+                        self.assertEqual(block.lake[idx], world_gen.is_lake(q, r))
+                        self.assertEqual(capped_block.flow_to[idx], capped.get_flow_to(q, r))
+                        self.assertEqual(capped_block.lake[idx], capped.is_lake(q, r))
+                        idx += 1
+                self.assertEqual(len(block.strength), idx)
+                self.assertEqual(len(capped_block.strength), idx)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import py_compile
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -29,6 +32,56 @@ def _run(cmd: list[str], cwd: Path) -> int:
     return completed.returncode
 
 
+def _compile(python_files: list[str], repo_root: Path) -> int:
+    # In-process compile skips an interpreter start; a worker pool costs more than ~30 files take.
+    print(f"[check] compiling {len(python_files)} python files")
+    failures = 0
+    for python_file in python_files:
+        try:
+            py_compile.compile(str(repo_root / python_file), doraise=True)
+        except py_compile.PyCompileError as exc:
+            print(exc.msg)
+            failures += 1
+    if failures:
+        print(f"[check] failed: {failures} file(s) did not compile")
+        return 1
+    return 0
+
+
+def _run_unittest(repo_root: Path) -> int:
+    """Run tests/test_*.py modules as parallel unittest processes, one per CPU.
+
+    Modules are independent and share fixtures only within a class, so running
+    them concurrently keeps per-class setup while overlapping the slow world
+    builds. Output is printed per module in discovery order. Single-CPU hosts
+    run the plain serial suite, where extra processes would only contend.
+    """
+    modules = [f"tests.{path.stem}" for path in sorted((repo_root / "tests").glob("test_*.py"))]
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    workers = min(len(modules), cpu_count)
+    if workers < 2:
+        return _run([sys.executable, "-m", "unittest", "-v"], repo_root)
+
+    def run_module(module: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "unittest", "-v", module],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+
+    print(f"[check] running: unittest -v ({len(modules)} modules, {workers} workers)")
+    rc = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for module, completed in zip(modules, executor.map(run_module, modules)):
+            print(completed.stdout, end="")
+            if completed.returncode != 0:
+                print(f"[check] failed ({completed.returncode}): unittest {module}")
+                rc = rc or completed.returncode
+    return rc
+
+
 def _tracked_python_files(repo_root: Path) -> list[str]:
     try:
         completed = subprocess.run(
@@ -46,10 +99,11 @@ def _tracked_python_files(repo_root: Path) -> list[str]:
 
 def _fallback_python_files(repo_root: Path) -> list[str]:
     python_files: list[str] = []
-    for path in repo_root.rglob("*.py"):
-        if any(part in IGNORED_DIRS for part in path.relative_to(repo_root).parts):
-            continue
-        python_files.append(str(path.relative_to(repo_root)))
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        # Prune ignored directories in place so os.walk never descends into them.
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+        rel_dir = Path(dirpath).relative_to(repo_root)
+        python_files.extend(str(rel_dir / name) for name in filenames if name.endswith(".py"))
     return sorted(python_files)
 
 
@@ -64,11 +118,11 @@ def main() -> int:
         print("[check] no python files found")
         return 1
 
-    rc = _run([sys.executable, "-m", "py_compile", *python_files], repo_root)
+    rc = _compile(python_files, repo_root)
     if rc != 0:
         return rc
 
-    rc = _run([sys.executable, "-m", "unittest", "-v"], repo_root)
+    rc = _run_unittest(repo_root)
     if rc != 0:
         return rc
 